@@ -6,6 +6,7 @@ import argparse
 from datetime import datetime, timezone
 import gzip
 import json
+import os
 from pathlib import Path
 import sys
 from typing import Iterable, Mapping
@@ -67,7 +68,10 @@ def _serialize_dictionary(dictionary: Dictionary) -> dict:
     """
     words = sorted(dictionary.words)
     ligature_map = dictionary._ligature_map.copy()
-    accent_map = {k: list(v) for k, v in dictionary._accent_map.items()}
+    accent_map = {
+        k: [v] if isinstance(v, str) else list(v)
+        for k, v in dictionary._accent_map.items()
+    }
 
     return {
         "schema_version": SCHEMA_VERSION,
@@ -88,6 +92,9 @@ def _serialize_dictionary(dictionary: Dictionary) -> dict:
 def _write_gz_json(path: Path, payload: Mapping[str, object]) -> None:
     """Write the given payload as UTF-8 JSON compressed with gzip.
 
+    The file is written next to its destination and then moved into place,
+    so an interrupted build never leaves a truncated artifact behind.
+
     Args:
         path: Destination file path.
         payload: JSON-serializable mapping to serialize.
@@ -95,8 +102,14 @@ def _write_gz_json(path: Path, payload: Mapping[str, object]) -> None:
     data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
         "utf-8"
     )
-    with gzip.open(path, mode="wb") as handle:
-        handle.write(data)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with gzip.open(tmp_path, mode="wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def main(argv: Iterable[str] | None = None) -> int:
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+import gc
+import os
 from pathlib import Path
 import re
 import sys
-from typing import Iterable, List, Sequence, Tuple
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
 from .constants import DEFAULT_ADMONITION_TRANSLATIONS
+from .dictionary import get_dictionary
 from .plugin import FrenchPlugin, Level, make_plugin_config
 
 from .artifacts.build import build_morphalou_artifact
@@ -27,6 +32,9 @@ class _Segment:
     ignored: bool
 
 
+_FileAnalysis = Tuple[Path, str, List[dict[str, object]], str]
+
+
 def main(argv: Iterable[str] | None = None) -> int:
     """Execute the command-line interface.
 
@@ -36,6 +44,23 @@ def main(argv: Iterable[str] | None = None) -> int:
     Returns:
         Exit code (zero on success, non-zero on error or misuse).
     """
+    parser = _build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    if not getattr(args, "handler", None):
+        parser.print_help(sys.stderr)
+        return 1
+
+    return args.handler(args)
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parsing leaves it unchanged.
+
+    Returns:
+        Parser with the ``build``, ``check`` and ``fix`` sub-commands.
+    """
     parser = argparse.ArgumentParser(
         prog="mkdocs-french", description="Auxiliary tooling for mkdocs-plugin-french."
     )
@@ -44,14 +69,7 @@ def main(argv: Iterable[str] | None = None) -> int:
     _configure_build_parser(subparsers)
     _configure_check_parser(subparsers)
     _configure_fix_parser(subparsers)
-
-    args = parser.parse_args(list(argv) if argv is not None else None)
-
-    if not getattr(args, "handler", None):
-        parser.print_help(sys.stderr)
-        return 1
-
-    return args.handler(args)
+    return parser
 
 
 def _configure_build_parser(
@@ -118,6 +136,7 @@ def _configure_check_parser(
         default=Path("docs"),
         help="Directory containing Markdown sources (default: docs).",
     )
+    _add_jobs_argument(check_parser)
     check_parser.set_defaults(handler=_run_check)
 
 
@@ -135,9 +154,37 @@ def _configure_fix_parser(
         default=Path("docs"),
         help="Directory containing Markdown sources (default: docs).",
     )
+    _add_jobs_argument(fix_parser)
     fix_parser.set_defaults(handler=_run_fix)
 
 
+def _add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    """Register the ``--jobs`` option shared by the ``check`` and ``fix`` commands."""
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_job_count,
+        default=1,
+        help=(
+            "Number of worker processes analyzing files; 0 uses every CPU "
+            "(default: 1)."
+        ),
+    )
+
+
+def _job_count(value: str) -> int:
+    """Parse a ``--jobs`` value, where ``0`` stands for the number of CPUs."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(
+            f"expected a non-negative integer, got {value!r}"
+        )
+    return number or os.cpu_count() or 1
+
+
 def _run_check(args: argparse.Namespace) -> int:
     """Display the corrections that would be applied without modifying files."""
 
@@ -147,10 +194,8 @@ def _run_check(args: argparse.Namespace) -> int:
         return 1
 
     issues_found = False
-    for path in _iter_markdown_files(docs_dir):
-        plugin = _build_cli_plugin()
-        original = path.read_text(encoding="utf-8")
-        issues, _ = _analyze_markdown(original, plugin)
+    paths = _iter_markdown_files(docs_dir)
+    for path, _, issues, _ in _analyze_files(paths, args.jobs):
         if not issues:
             continue
 
@@ -182,10 +227,8 @@ def _run_fix(args: argparse.Namespace) -> int:
         return 1
 
     updated_files: List[Path] = []
-    for path in _iter_markdown_files(docs_dir):
-        plugin = _build_cli_plugin()
-        original = path.read_text(encoding="utf-8")
-        issues, fixed = _analyze_markdown(original, plugin)
+    paths = _iter_markdown_files(docs_dir)
+    for path, original, issues, fixed in _analyze_files(paths, args.jobs):
         if original == fixed:
             continue
         path.write_text(fixed, encoding="utf-8")
@@ -200,8 +243,53 @@ def _run_fix(args: argparse.Namespace) -> int:
     return 0
 
 
+def _analyze_files(paths: Sequence[Path], jobs: int) -> Iterator[_FileAnalysis]:
+    """Analyze Markdown files, in worker processes when ``jobs`` > 1.
+
+    Files are independent, so they are distributed over a process pool;
+    results are yielded in the order of ``paths`` either way.
+
+    Args:
+        paths: Markdown files to analyze.
+        jobs: Maximum number of worker processes.
+
+    Yields:
+        Tuples of path, original text, pending issues and corrected text.
+    """
+    if jobs > 1 and len(paths) > 1:
+        workers = min(jobs, len(paths))
+        chunksize = max(1, len(paths) // (workers * 4))
+        # Load the plugin and the dictionary before forking so that workers
+        # inherit them; freezing the heap keeps the collector from writing to
+        # (and thus copying) those shared pages in every worker.
+        _build_cli_plugin()
+        get_dictionary()
+        gc.freeze()
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(_analyze_file, paths, chunksize=chunksize)
+        finally:
+            gc.unfreeze()
+    else:
+        yield from map(_analyze_file, paths)
+
+
+def _analyze_file(path: Path) -> _FileAnalysis:
+    """Read and analyze a single Markdown file with the shared CLI plugin."""
+    plugin = _build_cli_plugin()
+    original = path.read_text(encoding="utf-8")
+    issues, fixed = _analyze_markdown(original, plugin)
+    return path, original, issues, fixed
+
+
+@lru_cache(maxsize=1)
 def _build_cli_plugin() -> FrenchPlugin:
-    """Instantiate a plugin configured for standalone Markdown processing."""
+    """Instantiate a plugin configured for standalone Markdown processing.
+
+    The CLI only uses the plugin's stateless helpers, so a single instance
+    per process serves every file and keeps its compiled foreign-locution
+    pattern between them.
+    """
 
     plugin = FrenchPlugin()
     plugin.config = make_plugin_config(
@@ -234,13 +322,17 @@ def _analyze_markdown(
         if level_value == Level.ignore.value:
             continue
 
-        current_text = _segments_to_text(segments)
+        # The joined page is only needed to place findings; most rules report
+        # none, so avoid rebuilding the whole text once per rule.
+        current_text: str | None = None
         offset = 0
         for segment in segments:
             segment_length = len(segment.text)
-            if not segment.ignored:
+            if not segment.ignored and rule.may_apply(segment.text):
                 findings = rule.detect(segment.text)
                 for start, _end, message, preview in findings:
+                    if current_text is None:
+                        current_text = _segments_to_text(segments)
                     absolute_start = offset + start
                     issues.append(
                         {
@@ -256,7 +348,7 @@ def _analyze_markdown(
 
         if level_value == Level.fix.value:
             for segment in segments:
-                if segment.ignored:
+                if segment.ignored or not rule.may_apply(segment.text):
                     continue
                 segment.text = rule.fix(segment.text)
 
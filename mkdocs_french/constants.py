@@ -4,8 +4,8 @@ NBSP = "\u00a0"  # non-breaking space
 NNBSP = "\u202f"  # narrow non-breaking space
 ELLIPSIS = "\u2026"
 
-SKIP_TAGS = {"code", "pre", "kbd", "samp", "var", "script", "style", "math"}
-SKIP_PARENTS = {"a", "time", "data", "span"}
+SKIP_TAGS = frozenset({"code", "pre", "kbd", "samp", "var", "script", "style", "math"})
+SKIP_PARENTS = frozenset({"a", "time", "data", "span"})
 
 DEFAULT_ADMONITION_TRANSLATIONS = {
     "note": "Note",
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 import gzip
+from itertools import repeat
 import json
 import logging
+import os
 from pathlib import Path
 import re
 import shutil
 import tempfile
+from typing import IO
 import unicodedata
 import xml.etree.ElementTree as ET
 import zipfile
@@ -20,6 +24,12 @@ import requests
 from .artifacts import SCHEMA_VERSION, default_data_path
 
 
+try:  # orjson is optional; it parses the artifact several times faster
+    import orjson
+except ImportError:  # pragma: no cover - environment without orjson
+    orjson = None
+
+
 log = logging.getLogger("mkdocs.plugins.fr_typo")
 
 
@@ -76,6 +86,26 @@ FALLBACK_WORDS: set[str] = {
 }
 
 
+# Bound of the per-dictionary memo of ``accentize``/``ligaturize`` results.
+WORD_CACHE_SIZE = 65536
+
+# Accent index value: the bare string when a base has a single variant (the
+# vast majority), otherwise the tuple of variants.
+AccentEntry = str | tuple[str, ...]
+
+
+def _compact_accent_entry(variants: tuple[str, ...]) -> AccentEntry:
+    """Return the accent index value storing ``variants``.
+
+    Args:
+        variants: Ordered accent variants of a base form.
+
+    Returns:
+        The single variant itself, or the tuple when there are several.
+    """
+    return variants[0] if len(variants) == 1 else variants
+
+
 @lru_cache(maxsize=131072)
 def _strip_diacritics_cached(s: str) -> str:
     """Strip diacritics from a string while caching results.
@@ -91,8 +121,10 @@ def _strip_diacritics_cached(s: str) -> str:
         >>> _strip_diacritics_cached("Élévation")
         'Elevation'
     """
+    if s.isascii():  # ASCII has no diacritics and is invariant under NFD/NFC
+        return s
     normalized = unicodedata.normalize("NFD", s)
-    stripped = "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    stripped = "".join([ch for ch in normalized if not unicodedata.combining(ch)])
     return unicodedata.normalize("NFC", stripped)
 
 
@@ -139,17 +171,17 @@ class Dictionary:
         self.use_static_data = use_static_data
         self._data_path = Path(data_path) if data_path else default_data_path()
         self.zip_path: Path | None = None
-        self.extract_dir: Path | None = None
         self.words: set[str] = set(FALLBACK_WORDS)
         self._clean_after = workdir is None
         self._ligature_map: dict[str, str] = {}
-        self._accent_map: dict[str, tuple[str, ...]] = {}
+        self._accent_map: dict[str, AccentEntry] = {}
         self._prepared = False
         self._prepare_attempted = False
 
         if self.use_static_data and self._load_static_data():
             self._prepared = True
             self._prepare_attempted = True
+            self._reset_word_caches()
         else:
             self._build_indexes()
 
@@ -164,7 +196,6 @@ class Dictionary:
         self._prepare_attempted = True
         try:
             self._download_latest_zip()
-            self._extract_zip()
             self._parse_all_xml()
         except Exception as exc:  # pragma: no cover - network/environment dependent
             log.warning("Impossible de préparer Morphalou (mode secours) : %s", exc)
@@ -216,68 +247,73 @@ class Dictionary:
         self.zip_path = out_path
         return out_path
 
-    def _extract_zip(self) -> Path:  # pragma: no cover - network dependent
-        """Extract the TEI archive into a dedicated folder.
+    def _parse_all_xml(self) -> None:
+        """Parse every XML file of the TEI archive to populate the word list.
 
-        Returns:
-            Path to the directory containing the extracted XML files.
+        The entries are streamed straight from the ZIP archive, without
+        extracting them to disk first; archives split into several XML files
+        are parsed in parallel worker processes. This step extracts various
+        orthography fields and adds them to :attr:`words`. Parsing errors are
+        ignored to ensure resilience.
 
         Raises:
             RuntimeError: If called before a ZIP archive has been downloaded.
         """
         if not self.zip_path:
-            raise RuntimeError("Aucun ZIP à extraire. Appelez d'abord prepare().")
-        extract_dir = self.workdir / "tei_extracted"
-        extract_dir.mkdir(exist_ok=True)
-        with zipfile.ZipFile(self.zip_path, "r") as archive:
-            archive.extractall(extract_dir)
-        self.extract_dir = extract_dir
-        return extract_dir
+            raise RuntimeError("Aucun ZIP à analyser. Appelez d'abord prepare().")
 
-    def _parse_all_xml(self) -> None:  # pragma: no cover - heavy parsing
-        """Parse every extracted XML file to populate the word list.
-
-        This step extracts various orthography fields and adds them to
-        :attr:`words`. Parsing errors are ignored to ensure resilience.
-        """
-        if not self.extract_dir:
-            raise RuntimeError("Aucun dossier extrait. Appelez prepare() d'abord.")
+        with zipfile.ZipFile(self.zip_path, "r") as archive:
+            xml_names = [
+                name for name in archive.namelist() if name.lower().endswith(".xml")
+            ]
+
+        workers = min(len(xml_names), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = list(
+                    executor.map(
+                        _collect_member_words, repeat(self.zip_path), xml_names
+                    )
+                )
+        else:
+            chunks = [_collect_member_words(self.zip_path, name) for name in xml_names]
 
-        xml_files = list(self.extract_dir.rglob("*.xml"))
-        words: set[str] = set()
+        words = {w for chunk in chunks for w in chunk if self._is_potential_word(w)}
 
-        for xml_path in xml_files:
-            try:
-                for _event, elem in ET.iterparse(str(xml_path), events=("end",)):
-                    tag = self._strip_ns(elem.tag)
-                    if (
-                        tag in {"orth", "orthography"}
-                        and elem.text
-                        and elem.text.strip()
-                    ):
-                        words.add(elem.text.strip())
-
-                    if tag in {"form", "orthogr"}:
-                        for attr in ("orth", "lemma", "entry", "writtenForm"):
-                            value = elem.attrib.get(attr)
-                            if value and value.strip():
-                                words.add(value.strip())
-                        for child in elem:
-                            ctag = self._strip_ns(child.tag)
-                            if (
-                                ctag in {"orth", "orthography"}
-                                and child.text
-                                and child.text.strip()
-                            ):
-                                words.add(child.text.strip())
-            except ET.ParseError:
-                continue
+        self.words = words
+        # New containers rather than clear(): copies may share the old ones.
+        self._ligature_map = {}
+        self._accent_map = {}
 
-        words = {w for w in words if self._is_potential_word(w)}
+    @staticmethod
+    def _collect_words(source: IO[bytes], words: set[str]) -> None:
+        """Add the orthographic forms found in one TEI document to ``words``.
 
-        self.words = words
-        self._ligature_map.clear()
-        self._accent_map.clear()
+        Args:
+            source: Binary stream holding the XML document.
+            words: Set receiving the extracted forms.
+        """
+        # A TEI file repeats a handful of namespaced tags millions of times.
+        local_names: dict[str, str] = {}
+        try:
+            for _event, elem in ET.iterparse(source, events=("end",)):
+                tag = local_names.get(elem.tag)
+                if tag is None:
+                    tag = local_names[elem.tag] = Dictionary._strip_ns(elem.tag)
+
+                # Nested ``orth`` children reach this branch through their own
+                # end event, before the enclosing ``form``.
+                if tag in {"orth", "orthography"}:
+                    text = elem.text.strip() if elem.text else ""
+                    if text:
+                        words.add(text)
+                elif tag in {"form", "orthogr"}:
+                    for attr in ("orth", "lemma", "entry", "writtenForm"):
+                        value = elem.attrib.get(attr)
+                        if value and value.strip():
+                            words.add(value.strip())
+        except ET.ParseError:
+            return
 
     # ------------------ Public API ------------------
 
@@ -294,6 +330,10 @@ class Dictionary:
         if not word:
             return word
         self._ensure_ready()
+        return self._ligaturize_cached(word)
+
+    def _ligaturize(self, word: str) -> str:
+        """Uncached implementation of :meth:`ligaturize`."""
         key = self.normaliser_ascii(word).lower()
         candidate = self._ligature_map.get(key)
         if not candidate:
@@ -313,7 +353,10 @@ class Dictionary:
         if not word:
             return word
         self._ensure_ready()
+        return self._accentize_cached(word)
 
+    def _accentize(self, word: str) -> str:
+        """Uncached implementation of :meth:`accentize`."""
         lower_word = word.lower()
         base = _strip_diacritics_cached(lower_word)
         candidates = self._get_accent_candidates(base)
@@ -386,7 +429,7 @@ class Dictionary:
             key: sorted(values)[0] for key, values in ligature_candidates.items()
         }
 
-        accent_map: dict[str, tuple[str, ...]] = {}
+        accent_map: dict[str, AccentEntry] = {}
         for base, variants in accent_variants.items():
             if not variants:
                 continue
@@ -394,8 +437,14 @@ class Dictionary:
             if base in accent_ascii_present:
                 ordered.append(base)
             ordered.extend(sorted(variants))
-            accent_map[base] = tuple(ordered)
+            accent_map[base] = _compact_accent_entry(tuple(ordered))
         self._accent_map = accent_map
+        self._reset_word_caches()
+
+    def _reset_word_caches(self) -> None:
+        """Discard memoized lookups; required whenever the indexes change."""
+        self._accentize_cached = lru_cache(maxsize=WORD_CACHE_SIZE)(self._accentize)
+        self._ligaturize_cached = lru_cache(maxsize=WORD_CACHE_SIZE)(self._ligaturize)
 
     # ------------------ Helpers ------------------
 
@@ -413,10 +462,11 @@ class Dictionary:
 
         try:
             with gzip.open(path, "rb") as handle:
-                payload = json.load(handle)
+                raw = handle.read()
+            payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except FileNotFoundError:
             return False
-        except (OSError, json.JSONDecodeError) as exc:
+        except (OSError, ValueError) as exc:
             log.warning("Artéfact Morphalou illisible (%s) : %s", path, exc)
             return False
 
@@ -468,7 +518,7 @@ class Dictionary:
                 if isinstance(key, str) and isinstance(value, str)
             }
             accent_map = {
-                key: tuple(variants)
+                key: _compact_accent_entry(tuple(variants))
                 for key, variants in accent_field.items()
                 if isinstance(key, str) and isinstance(variants, list)
             }
@@ -488,13 +538,13 @@ class Dictionary:
                 if isinstance(key, str) and isinstance(value, str)
             }
 
-            accent_map: dict[str, tuple[str, ...]] = {}
+            accent_map: dict[str, AccentEntry] = {}
             for key, variants in accent_field.items():
                 if not isinstance(key, str) or not isinstance(variants, list):
                     continue
                 normalized = self._normalize_accent_entry(key, variants)
                 if normalized:
-                    accent_map[key] = normalized
+                    accent_map[key] = _compact_accent_entry(normalized)
 
         if not words:  # pragma: no cover - validation guard
             log.warning("Artéfact Morphalou invalide : aucune entrée exploitable.")
@@ -574,7 +624,7 @@ class Dictionary:
     @staticmethod
     def _contient_ligature(text: str) -> bool:
         """Return whether the string contains œ/æ ligatures."""
-        return any(char in text for char in ("œ", "Œ", "æ", "Æ"))
+        return "œ" in text or "æ" in text or "Œ" in text or "Æ" in text
 
     @staticmethod
     def _apply_casing(original: str, suggestion_lower: str) -> str:
@@ -591,11 +641,9 @@ class Dictionary:
             return suggestion_lower
         if original.isupper():
             return suggestion_lower.upper()
-        if original.islower():
-            return suggestion_lower
-        if original[0].isupper() and original[1:].islower():
-            return suggestion_lower[0].upper() + suggestion_lower[1:]
-        if original[0].isupper():
+        # Title case and any other word starting with a capital only carry the
+        # initial over; lowercase words already match the suggestion.
+        if original[:1].isupper():
             return suggestion_lower[0].upper() + suggestion_lower[1:]
         return suggestion_lower
 
@@ -616,19 +664,18 @@ class Dictionary:
         if len(original_lower) != len(candidate_lower):
             return False
         for orig_char, cand_char in zip(original_lower, candidate_lower):
-            if _strip_diacritics_cached(orig_char) != _strip_diacritics_cached(
-                cand_char
-            ):
+            if orig_char == cand_char:
+                continue
+            # A differing character is only acceptable when the source one is
+            # bare and the candidate merely adds a diacritic to it.
+            if orig_char != _strip_diacritics_cached(cand_char):
                 return False
-            if (
-                orig_char != _strip_diacritics_cached(orig_char)
-                and orig_char != cand_char
-            ):
+            if orig_char != _strip_diacritics_cached(orig_char):
                 return False
         return True
 
     def _get_accent_candidates(self, base: str) -> tuple[str, ...]:
-        """Retrieve accent candidates for a base form using the internal cache.
+        """Retrieve accent candidates for a base form from the accent index.
 
         Args:
             base: Normalized base form (without diacritics).
@@ -636,13 +683,10 @@ class Dictionary:
         Returns:
             Tuple of candidate strings; empty tuple when no candidates exist.
         """
-        cached = self._accent_map.get(base)
-        if cached is not None:
-            return cached
-
-        # Bases absent from the precomputed map have no accent variants.
-        self._accent_map[base] = ()
-        return ()
+        # Misses are not recorded: the index only holds bases that have accent
+        # variants, and repeated lookups are already memoized by accentize.
+        entry = self._accent_map.get(base, ())
+        return (entry,) if isinstance(entry, str) else entry
 
     def _augment_indexes_with_fallbacks(self) -> None:
         """Inject fallback words into ligature and diacritic indexes."""
@@ -653,9 +697,11 @@ class Dictionary:
                 self._ligature_map.setdefault(ascii_word, lower_word)
 
             base = _strip_diacritics_cached(lower_word)
-            current = list(self._accent_map.get(base, ()))
+            current = list(self._get_accent_candidates(base))
             current.append(lower_word)
-            self._accent_map[base] = self._normalize_accent_entry(base, current)
+            self._accent_map[base] = _compact_accent_entry(
+                self._normalize_accent_entry(base, current)
+            )
 
     @staticmethod
     def _normalize_accent_entry(base: str, variants: Iterable[str]) -> tuple[str, ...]:
@@ -687,6 +733,24 @@ class Dictionary:
         return tuple(ascii_variants + sorted(other_variants))
 
 
+def _collect_member_words(zip_path: Path, name: str) -> set[str]:
+    """Return the word forms of one XML member of a TEI archive.
+
+    Defined at module level so that worker processes can unpickle it.
+
+    Args:
+        zip_path: Path to the Morphalou ZIP archive.
+        name: Name of the XML member to parse.
+
+    Returns:
+        Raw orthographic forms found in the member.
+    """
+    words: set[str] = set()
+    with zipfile.ZipFile(zip_path, "r") as archive, archive.open(name) as xml_file:
+        Dictionary._collect_words(xml_file, words)
+    return words
+
+
 @lru_cache(maxsize=1)
 def get_dictionary() -> Dictionary:
     """Return a cached :class:`Dictionary` instance.
@@ -4,12 +4,16 @@
 # pylint: disable=invalid-name
 from __future__ import annotations
 
-from collections.abc import Iterable, MutableMapping
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+import hashlib
 import logging
 from pathlib import Path
 import re
 import shutil
+import sys
 from typing import Any, cast
 from types import SimpleNamespace
 
@@ -38,7 +42,27 @@ from .rules import (
 
 
 ConfigTranslationMap = MutableMapping[str, str | None]
-WarningEntry = dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class WarningEntry:
+    """Warning recorded for the end-of-build summary.
+
+    Attributes:
+        rule: Name of the rule that reported the warning.
+        file: Normalized path of the page.
+        line: Line of the warning in the page source, when known.
+        column: Column of the warning in the page source, when known.
+        message: Human-readable explanation of the issue.
+        preview: Optional preview of the proposed fix.
+    """
+
+    rule: str
+    file: str
+    line: int | None
+    column: int | None
+    message: str
+    preview: str | None
 
 
 try:  # rich is optional to keep compatibility without the dependency installed
@@ -52,11 +76,14 @@ except ImportError:  # pragma: no cover - environment without rich
 
 log = logging.getLogger("mkdocs.plugins.fr_typo")
 
+# Possessive quantifiers (Python 3.11+) keep the engine from backtracking into
+# runs that can never be given back to produce a match.
+_POSSESSIVE = "+" if sys.version_info >= (3, 11) else ""
 RE_ADMONITION = re.compile(
-    r"""^(?P<indent>\s*)(?P<marker>!!!|\?\?\?\+?)\s+"""
-    r"""(?P<type>[A-Za-z0-9_-]+)"""
-    r"""(?P<options>(?:\s+(?!")[^\s]+)*)"""
-    r"""(?:\s+"(?P<title>[^"]*)")?\s*$"""
+    rf"""^(?P<indent>\s*{_POSSESSIVE})(?P<marker>!!!|\?\?\?\+?)\s+{_POSSESSIVE}"""
+    rf"""(?P<type>[A-Za-z0-9_-]+{_POSSESSIVE})"""
+    rf"""(?P<options>(?:\s+{_POSSESSIVE}(?!")[^\s]+{_POSSESSIVE})*{_POSSESSIVE})"""
+    rf"""(?:\s+"(?P<title>[^"]*{_POSSESSIVE})")?\s*{_POSSESSIVE}$"""
 )
 
 RE_INLINE_SPAN = re.compile(
@@ -70,6 +97,203 @@ RE_FENCED_CODE = re.compile(
 )
 
 RE_INLINE_CODE = re.compile(r"`[^`\n]+`")
+RE_HTML_EMPHASIS = re.compile(r"<(em|i)\b[^>]*>(.*?)</\1>", re.IGNORECASE | re.DOTALL)
+# Without these, ignored subtrees cannot affect the rest of the page.
+RE_IGNORE_BLOCK_MARKER = re.compile(r"fr-typo-ignore-(?:start|end)", re.IGNORECASE)
+
+# Text nodes up to this length have their foreign-locution matches memoized.
+FOREIGN_MATCH_CACHE_MAX_LENGTH = 200
+
+ForeignMatch = tuple[int, int, str]
+
+
+@lru_cache(maxsize=2048)
+def _cached_foreign_matches(
+    pattern: re.Pattern[str], text: str
+) -> tuple[ForeignMatch, ...]:
+    """Memoized variant of :func:`find_foreign_matches` for short texts."""
+    return tuple((m.start(), m.end(), m.group(1)) for m in pattern.finditer(text))
+
+
+def find_foreign_matches(
+    pattern: re.Pattern[str], text: str
+) -> tuple[ForeignMatch, ...]:
+    """Return ``(start, end, phrase)`` tuples for foreign locutions in ``text``.
+
+    Short strings (labels, captions, table cells) repeat a lot across pages,
+    so their results are kept in a bounded cache.
+
+    Args:
+        pattern: Compiled foreign-locution pattern.
+        text: Text to scan.
+
+    Returns:
+        Matches in document order.
+    """
+    if len(text) <= FOREIGN_MATCH_CACHE_MAX_LENGTH:
+        return _cached_foreign_matches(pattern, text)
+    return tuple((m.start(), m.end(), m.group(1)) for m in pattern.finditer(text))
+
+
+ITALIC_TAGS = frozenset({"em", "i"})
+
+
+def _is_opted_out(tag: Tag) -> bool:
+    """Return whether an element opts out of typography processing."""
+    classes = tag.get("class") or ()
+    if "fr-typo-ignore" in classes or tag.get("data-fr-typo") == "ignore":
+        return True
+    return tag.name in ("code", "span") and "nohighlight" in classes
+
+
+def _first_child(tag: BeautifulSoup | Tag) -> PageElement | None:
+    """Return the first child of ``tag``, or ``None`` when it is empty."""
+    contents = tag.contents
+    return contents[0] if contents else None
+
+
+def iter_text_nodes(
+    root: BeautifulSoup | Tag,
+    *,
+    block_markers: bool = True,
+) -> Iterator[tuple[NavigableString, bool]]:
+    """Walk ``root`` once and yield the text nodes typography rules may rewrite.
+
+    Ignore state is tracked while descending instead of being precomputed:
+
+    - elements with the ``fr-typo-ignore`` class or ``data-fr-typo="ignore"``
+      (and ``code``/``span`` elements with ``nohighlight``) are skipped along
+      with their descendants;
+    - ``<!--fr-typo-ignore-->`` protects the next meaningful sibling;
+    - ``<!--fr-typo-ignore-start-->`` / ``<!--fr-typo-ignore-end-->`` delimit
+      ignored regions in document order; an unterminated start marker covers
+      the rest of the page;
+    - :data:`SKIP_TAGS` elements (code, scripts, math...) are pruned without
+      visiting their descendants, and text directly under
+      :data:`SKIP_PARENTS` is never yielded.
+
+    Ignored elements are only descended into to follow block markers; when
+    ``block_markers`` is false, they are pruned like :data:`SKIP_TAGS`.
+
+    Siblings are followed through ``next_sibling`` without copying child
+    lists; the next sibling is read before a node is yielded, so callers may
+    replace the yielded node while iterating.
+
+    Args:
+        root: Document or element holding the page fragment.
+        block_markers: Whether the fragment may contain ignore-start/end
+            markers (see :data:`RE_IGNORE_BLOCK_MARKER`).
+
+    Yields:
+        Tuples of the text node and whether it sits in an italic context.
+    """
+    in_ignored_block = False
+    inline_target_parent: Tag | None = None
+    # (next child to visit, parent, ignored, italic context)
+    stack: list[tuple[PageElement | None, Tag, bool, bool]] = [
+        (_first_child(root), root, False, False)
+    ]
+    while stack:
+        child, parent, ignored, italic = stack[-1]
+        if child is None:
+            stack.pop()
+            if inline_target_parent is parent:
+                inline_target_parent = None
+            continue
+        stack[-1] = (child.next_sibling, parent, ignored, italic)
+
+        if isinstance(child, NavigableString):
+            # Whitespace-only strings are never rewritten nor protected.
+            if not child or child.isspace():
+                continue
+            protected = inline_target_parent is parent
+            if protected:
+                inline_target_parent = None
+
+            if isinstance(child, Comment):
+                directive = child.strip().lower()
+                if directive == "fr-typo-ignore-start":
+                    in_ignored_block = True
+                elif directive == "fr-typo-ignore-end":
+                    in_ignored_block = False
+                elif directive == "fr-typo-ignore":
+                    inline_target_parent = parent
+                continue
+
+            if not (
+                ignored
+                or protected
+                or in_ignored_block
+                or parent.name in SKIP_PARENTS
+            ):
+                yield child, italic
+            continue
+
+        protected = inline_target_parent is parent
+        if protected:
+            inline_target_parent = None
+
+        if isinstance(child, Tag):
+            name = child.name
+            if name in SKIP_TAGS:
+                continue
+            child_ignored = ignored or protected or _is_opted_out(child)
+            if child_ignored and not block_markers:
+                continue
+            stack.append(
+                (
+                    _first_child(child),
+                    child,
+                    child_ignored,
+                    italic or name in ITALIC_TAGS,
+                )
+            )
+
+
+def _digest(text: str) -> bytes:
+    """Return a short digest of ``text`` used to key the rebuild caches."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _translate_admonition_titles(
+    markdown: str, translations: Mapping[str, str]
+) -> str | None:
+    """Return ``markdown`` with untitled admonitions given a translated title.
+
+    Args:
+        markdown: Page source.
+        translations: Configured title for each admonition type.
+
+    Returns:
+        The translated source, or ``None`` when no admonition needed a title.
+    """
+    lines = markdown.splitlines(keepends=True)
+    changed = False
+
+    for idx, raw in enumerate(lines):
+        if not raw.lstrip().startswith(("!!!", "???")):
+            continue
+        body = raw.rstrip("\r\n")
+        newline = raw[len(body) :]
+        match = RE_ADMONITION.match(body)
+        if not match:
+            continue
+        admonition_type = match.group("type")
+        title = match.group("title")
+        translation = translations.get(admonition_type.lower())
+        if translation is None or (title and title.strip()):
+            continue
+
+        indent = match.group("indent")
+        marker = match.group("marker")
+        options = match.group("options") or ""
+        lines[idx] = (
+            f'{indent}{marker} {admonition_type}{options} "{translation}"{newline}'
+        )
+        changed = True
+
+    return "".join(lines) if changed else None
+
 
 # ---------- Class-based config ----------
 
@@ -126,6 +350,34 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
         self._html_orchestrator = RuleOrchestrator(build_html_rules())
         self._foreign_processed_pages: set[str] = set()
         self._foreign_pattern: re.Pattern[str] | None = None
+        # src_path -> (inputs, output) of the last warning-free HTML pass. Only
+        # enabled under ``mkdocs serve``, where unchanged pages are rebuilt.
+        self._html_cache: dict[str, tuple[tuple[Any, ...], str]] | None = None
+        self._previous_html_cache: dict[str, tuple[tuple[Any, ...], str]] = {}
+        # (source digest, translations) -> translated source, or None when
+        # unchanged. Enabled under ``mkdocs serve`` like the HTML cache.
+        self._admonition_cache: dict[tuple[Any, ...], str | None] | None = None
+        self._previous_admonition_cache: dict[tuple[Any, ...], str | None] = {}
+        self._warning_count = 0
+
+    def on_startup(self, *, command: str, dirty: bool) -> None:
+        """Opt into MkDocs' persistent plugin instances.
+
+        Defining this hook keeps the plugin alive across rebuilds of
+        ``mkdocs serve``, so unchanged pages are served from the admonition
+        and HTML caches. A one-off build can never hit those caches, so they
+        are not enabled then.
+
+        Args:
+            command: MkDocs command being run.
+            dirty: Whether ``--dirty`` was passed (unused).
+        """
+        del dirty
+        serve = command == "serve"
+        self._html_cache = {} if serve else None
+        self._previous_html_cache = {}
+        self._admonition_cache = {} if serve else None
+        self._previous_admonition_cache = {}
 
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig | None:
         """Enrich the MkDocs configuration with plugin-specific assets.
@@ -136,6 +388,18 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
         Returns:
             The possibly mutated configuration object.
         """
+        # The instance outlives a build under ``mkdocs serve``: reset build state.
+        self._collected_warnings = []
+        self._extra_css = set()
+        self._foreign_processed_pages.clear()
+        if self._html_cache is not None:
+            # Pages rendered again move back into the cache; the others are
+            # dropped at the next rebuild.
+            self._previous_html_cache, self._html_cache = self._html_cache, {}
+        if self._admonition_cache is not None:
+            self._previous_admonition_cache = self._admonition_cache
+            self._admonition_cache = {}
+
         translations: dict[str, str] = DEFAULT_ADMONITION_TRANSLATIONS.copy()
         config_translations = cast(
             ConfigTranslationMap, self.config.admonition_translations
@@ -225,6 +489,7 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
         """
         if not warnings:
             return
+        self._warning_count += len(warnings)
         normalized_path = self._normalize_path(src_path)
         location = self._format_location(normalized_path, cur_line, cur_column)
 
@@ -238,15 +503,16 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
                 prev_txt,
             )
             if self.config.summary:
-                warning_entry: WarningEntry = {
-                    "rule": warning.rule.name,
-                    "file": normalized_path,
-                    "line": cur_line,
-                    "column": cur_column,
-                    "message": warning.message,
-                    "preview": warning.preview,
-                }
-                self._collected_warnings.append(warning_entry)
+                self._collected_warnings.append(
+                    WarningEntry(
+                        rule=warning.rule.name,
+                        file=normalized_path,
+                        line=cur_line,
+                        column=cur_column,
+                        message=warning.message,
+                        preview=warning.preview,
+                    )
+                )
 
     def _source_path_for_page(self, page: Page) -> str:
         """Return the best-effort source path for the given MkDocs page."""
@@ -353,137 +619,98 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
             Updated HTML string with typography fixes applied.
         """
         del config, files
-        plugin_config: FrenchPluginConfig = self.config
         src_path = self._source_path_for_page(page)
-        soup = BeautifulSoup(html, "html.parser")
-
-        # 1) Collect FRL marker comments
-        comments = list(soup.find_all(string=lambda t: isinstance(t, Comment)))
-
-        # 2) Mark nodes contained inside ignore blocks
-        #    Iterate over comment pairs, gather the nodes between them,
-        #    then mark descendants.
-        nodes_to_skip_ids: set[int] = set()  # object ids sidestep Tag.__hash__ hot path
-
-        def _mark_ignore(node: PageElement | None) -> None:
-            if node is None:
-                return
-            nodes_to_skip_ids.add(id(cast(object, node)))
-            descendants = cast(Iterable[PageElement], getattr(node, "descendants", ()))
-            for descendant in descendants:
-                nodes_to_skip_ids.add(id(cast(object, descendant)))
-
-        def _element_name(element: PageElement) -> str | None:
-            return cast(str | None, getattr(element, "name", None))
-
-        # Map each comment to its position in document order
-        pos_map = {c: i for i, c in enumerate(comments)}
-
-        # Find inline and block ignore directives
-        for comment in comments:
-            txt = str(comment).strip()
-            if txt.lower() == "fr-typo-ignore-start":
-                # Locate the matching end comment
-                for c2 in comments[pos_map[comment] + 1 :]:
-                    if str(c2).strip().lower() == "fr-typo-ignore-end":
-                        # Mark every sibling between the start and end markers
-                        node = comment.next_sibling
-                        while node and node is not c2:
-                            _mark_ignore(node)
-                            node = node.next_sibling
-                        break
-            elif txt.lower() == "fr-typo-ignore":
-                # Single inline ignore: protect the following meaningful sibling
-                nxt = comment.next_sibling
-                while isinstance(nxt, NavigableString) and not nxt.strip():
-                    nxt = nxt.next_sibling
-                if nxt is not None:
-                    _mark_ignore(nxt)
-
-        # 3) Protect nodes opt-out via class or data attribute
-        for el in soup.select(".fr-typo-ignore, [data-fr-typo='ignore']"):
-            _mark_ignore(el)
-
-        # Preserve code/span elements with explicit opt-out hooks
-        for el in soup.select(
-            "code.nohighlight, code.fr-typo-ignore, code[data-fr-typo='ignore']"
-        ):
-            _mark_ignore(el)
-        for el in soup.select(
-            "span.nohighlight, span.fr-typo-ignore, span[data-fr-typo='ignore']"
-        ):
-            _mark_ignore(el)
-
-        # 4) Skip ignored nodes during traversal
-
-        # Depth-first traversal
-        for node in soup.descendants:
-            if isinstance(node, Comment):
-                continue
+        apply_foreign = (
+            self.config.foreign != Level.ignore
+            and src_path not in self._foreign_processed_pages
+        )
 
-            if isinstance(node, NavigableString):
-                parent = node.parent
-                if id(node) in nodes_to_skip_ids:
-                    continue
-                if parent and id(parent) in nodes_to_skip_ids:
-                    continue
-                if (
-                    not parent
-                    or parent.name in SKIP_TAGS
-                    or parent.name in SKIP_PARENTS
-                ):
-                    continue
-                ancestor_iter = cast(
-                    Iterable[PageElement], getattr(parent, "parents", ())
+        rule_levels = tuple(
+            self._level_for_rule(rule) for rule in self._html_orchestrator.rules
+        )
+        cache = self._html_cache
+        if not apply_foreign and all(level == Level.ignore for level in rule_levels):
+            # Nothing to do: skip parsing and walking the page entirely.
+            result = html
+        elif cache is None:
+            result = self._process_html(html, src_path, apply_foreign, rule_levels)
+        else:
+            # Pages that produced warnings are always reprocessed so that the
+            # warnings are reported again on every build.
+            inputs = (_digest(html), apply_foreign, self.config.foreign, rule_levels)
+            cached = cache.get(src_path) or self._previous_html_cache.pop(
+                src_path, None
+            )
+            if cached is not None and cached[0] == inputs:
+                result = cached[1]
+                cache[src_path] = cached
+            else:
+                warning_count = self._warning_count
+                result = self._process_html(
+                    html, src_path, apply_foreign, rule_levels
                 )
-                if any(_element_name(p) in SKIP_TAGS for p in ancestor_iter):
-                    continue
+                if self._warning_count == warning_count:
+                    cache[src_path] = (inputs, result)
+                else:
+                    cache.pop(src_path, None)
 
-                s = str(node)
-                if not s.strip():
-                    continue
+        if src_path != "<page>":
+            self._foreign_processed_pages.discard(src_path)
 
-                cfg = plugin_config
-                s, warnings = self._html_orchestrator.process(
+        return result
+
+    def _process_html(
+        self,
+        html: str,
+        src_path: str,
+        apply_foreign: bool,
+        rule_levels: tuple[Level | str, ...],
+    ) -> str:
+        """Apply the HTML rules and foreign-locution handling to a page.
+
+        Args:
+            html: Rendered HTML fragment of the page.
+            src_path: Source path of the page for diagnostics.
+            apply_foreign: Whether foreign locutions still need handling.
+            rule_levels: Levels of the HTML rules, in orchestrator order.
+
+        Returns:
+            The processed HTML fragment.
+        """
+        # Per-page invariants, resolved once instead of for every text node.
+        level_lookup = dict(zip(self._html_orchestrator.rules, rule_levels)).__getitem__
+        process = self._html_orchestrator.process
+        foreign_level = self.config.foreign
+        soup = BeautifulSoup(html, "html.parser")
+        block_markers = RE_IGNORE_BLOCK_MARKER.search(html) is not None
+
+        changed = False
+
+        for node, italic_context in iter_text_nodes(soup, block_markers=block_markers):
+            s, warnings = process(str(node), level_lookup)
+            self._emit_warnings(warnings, src_path, None)
+
+            if apply_foreign:
+                handled_foreign, s = self._apply_foreign(
                     s,
-                    self._level_for_rule,
+                    foreign_level,
+                    soup,
+                    node,
+                    node.parent,
+                    src_path,
+                    italic_context,
                 )
-                self._emit_warnings(warnings, src_path, None)
-
-                handled_foreign = False
-                if (
-                    cfg.foreign != Level.ignore
-                    and parent
-                    and src_path not in self._foreign_processed_pages
-                ):
-                    s_text = s if s != node else str(node)
-                    parents_chain: list[PageElement] = [parent]
-                    parents_chain.extend(
-                        cast(Iterable[PageElement], getattr(parent, "parents", ()))
-                    )
-                    italic_context = any(
-                        _element_name(p) in {"em", "i"} for p in parents_chain
-                    )
-                    handled_foreign, s_text = self._apply_foreign(
-                        s_text,
-                        cfg.foreign,
-                        soup,
-                        node,
-                        parent,
-                        src_path,
-                        italic_context,
-                    )
-                    if handled_foreign:
-                        continue
-                    s = s_text
-
-                if s != node:
-                    node.replace_with(NavigableString(s))
+                if handled_foreign:
+                    changed = True
+                    continue
 
-        if src_path != "<page>":
-            self._foreign_processed_pages.discard(src_path)
+            if s != node:
+                node.replace_with(NavigableString(s))
+                changed = True
 
-        return str(soup)
+        # Serializing costs about half as much as parsing: skip it when the
+        # page is untouched, which also leaves its markup exactly as rendered.
+        return str(soup) if changed else html
 
     def on_page_markdown(
         self,
@@ -538,10 +765,28 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
         css_dir.mkdir(parents=True, exist_ok=True)
         for entry in self._extra_css:
             dst = css_dir / Path(entry).name
+            if self._is_up_to_date(Path(entry), dst):
+                continue
             shutil.copyfile(entry, dst)
 
         if self.config.summary and self._collected_warnings:
             self._print_summary()
+        # The plugin instance outlives the build under ``mkdocs serve``: do not
+        # keep the reported warnings alive until the next rebuild.
+        self._collected_warnings = []
+
+    @staticmethod
+    def _is_up_to_date(src: Path, dst: Path) -> bool:
+        """Return whether ``dst`` already holds an up-to-date copy of ``src``."""
+        try:
+            dst_stat = dst.stat()
+        except FileNotFoundError:
+            return False
+        src_stat = src.stat()
+        return (
+            dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime >= src_stat.st_mtime
+        )
 
     def _apply_foreign(
         self,
@@ -580,20 +825,19 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
             )
             pattern = self._foreign_pattern
 
-        matches = list(pattern.finditer(text))
+        matches = find_foreign_matches(pattern, text)
         if not matches:
             return False, text
 
         if level == Level.warn:
-            for match in matches:
-                self._log_foreign_warning(match.group(1), src_path)
+            for _, _, phrase in matches:
+                self._log_foreign_warning(phrase, src_path)
             return False, text
 
         # Level.fix
         new_nodes: list[NavigableString | Tag] = []
         last_idx = 0
-        for match in matches:
-            start, end = match.span()
+        for start, end, phrase in matches:
             if start < last_idx:
                 continue
             before = text[last_idx:start]
@@ -602,11 +846,11 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
             if italic_context:
                 normal_span = soup.new_tag("span")
                 normal_span.attrs["style"] = "font-style: normal;"
-                normal_span.string = match.group(1)
+                normal_span.string = phrase
                 new_nodes.append(normal_span)
             else:
                 em_tag = soup.new_tag("em")
-                em_tag.string = match.group(1)
+                em_tag.string = phrase
                 new_nodes.append(em_tag)
             last_idx = end
         tail = text[last_idx:]
@@ -616,12 +860,7 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
         if not new_nodes:
             return False, text
 
-        first = new_nodes[0]
-        node.replace_with(first)
-        current = first
-        for new_child in new_nodes[1:]:
-            current.insert_after(new_child)
-            current = new_child
+        node.replace_with(*new_nodes)
         return True, text
 
     def _log_foreign_warning(
@@ -637,20 +876,21 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
             phrase: Foreign expression detected in the source.
             src_path: Page path used when logging the warning.
         """
+        self._warning_count += 1
         message = f"Locution étrangère non italique : «{phrase}»"
         normalized_path = self._normalize_path(src_path)
         location = self._format_location(normalized_path, line, column)
         log.warning("[fr-typo:foreign] %s: %s", location, message)
         if self.config.summary:
             self._collected_warnings.append(
-                {
-                    "rule": "foreign",
-                    "file": normalized_path,
-                    "line": line,
-                    "column": column,
-                    "message": message,
-                    "preview": phrase,
-                }
+                WarningEntry(
+                    rule="foreign",
+                    file=normalized_path,
+                    line=line,
+                    column=column,
+                    message=message,
+                    preview=phrase,
+                )
             )
 
     def _print_summary(self):
@@ -676,13 +916,9 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
         table.add_column("Suggestion", style="dim")
 
         for entry in self._collected_warnings:
-            location = self._format_location(
-                entry["file"], entry.get("line"), entry.get("column")
-            )
-            suggestion = f"«{entry['preview']}»" if entry["preview"] else ""
-            table.add_row(
-                entry["rule"], location, entry["message"], suggestion
-            )
+            location = self._format_location(entry.file, entry.line, entry.column)
+            suggestion = f"«{entry.preview}»" if entry.preview else ""
+            table.add_row(entry.rule, location, entry.message, suggestion)
 
         console = Console()
         console.print(table)
@@ -694,15 +930,9 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
         print("\n" + header)
         print("-" * len(header))
         for entry in self._collected_warnings:
-            location = self._format_location(
-                entry["file"], entry.get("line"), entry.get("column")
-            )
-            suggestion = (
-                f" | Suggestion: «{entry['preview']}»" if entry["preview"] else ""
-            )
-            print(
-                f"[{entry['rule']}] {location} -> {entry['message']}{suggestion}"
-            )
+            location = self._format_location(entry.file, entry.line, entry.column)
+            suggestion = f" | Suggestion: «{entry.preview}»" if entry.preview else ""
+            print(f"[{entry.rule}] {location} -> {entry.message}{suggestion}")
         print()
 
     @staticmethod
@@ -813,36 +1043,24 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
 
     def _translate_admonitions(self, markdown: str) -> str:
         """Translate admonition titles when no explicit title is provided."""
-        lines = markdown.splitlines(keepends=True)
-
-        def split_newline(text: str) -> tuple[str, str]:
-            if text.endswith("\r\n"):
-                return text[:-2], "\r\n"
-            if text.endswith("\n"):
-                return text[:-1], "\n"
-            if text.endswith("\r"):
-                return text[:-1], "\r"
-            return text, ""
-
-        for idx, raw in enumerate(lines):
-            body, newline = split_newline(raw)
-            match = RE_ADMONITION.match(body)
-            if not match:
-                continue
-            admonition_type = match.group("type")
-            title = match.group("title")
-            translation = self._admonition_translations.get(admonition_type.lower())
-            if translation is None or (title and title.strip()):
-                continue
-
-            indent = match.group("indent")
-            marker = match.group("marker")
-            options = match.group("options") or ""
-            lines[idx] = (
-                f'{indent}{marker} {admonition_type}{options} "{translation}"{newline}'
-            )
-
-        return "".join(lines)
+        # Cheap pre-test: the regex only matches behind these markers.
+        if "!!!" not in markdown and "???" not in markdown:
+            return markdown
+        translations = self._admonition_translations
+        cache = self._admonition_cache
+        if cache is None:
+            translated = _translate_admonition_titles(markdown, translations)
+        else:
+            key = (_digest(markdown), tuple(translations.items()))
+            if key in cache:
+                translated = cache[key]
+            elif key in self._previous_admonition_cache:
+                translated = self._previous_admonition_cache.pop(key)
+                cache[key] = translated
+            else:
+                translated = _translate_admonition_titles(markdown, translations)
+                cache[key] = translated
+        return markdown if translated is None else translated
 
     def _apply_foreign_markdown(
         self,
@@ -996,9 +1214,7 @@ class FrenchPlugin(BasePlugin[FrenchPluginConfig]):
 
             i += 1
 
-        for match in re.finditer(
-            r"<(em|i)\b[^>]*>(.*?)</\1>", markdown, re.IGNORECASE | re.DOTALL
-        ):
+        for match in RE_HTML_EMPHASIS.finditer(markdown):
             ranges.append((match.start(2), match.end(2)))
 
         ranges.sort()
@@ -12,6 +12,26 @@ _ABBR_PEX = re.compile(r"\b(p\s*\.?\s*ex)\b\.?", re.I)
 _ABBR_NB = re.compile(r"\b(n\s*\.?\s*b)\b\.?", re.I)
 _ETC_BAD = re.compile(r"\b(?P<word>etc)(?:\s*\.(?:\s*\.)+|\s*…+)(?=\W|$)", re.I)
 
+# Matches of these patterns cannot overlap and no replacement creates a new
+# match, so one alternation fixes the text exactly like four successive passes.
+_FIX_REPLACEMENTS = {
+    "bad": "c.-à-d.",
+    "pex": "p. ex.",
+    "nb": "N. B.",
+}
+_ABBR_ANY = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern.pattern})"
+        for name, pattern in (
+            ("bad", _ABBR_BAD),
+            ("pex", _ABBR_PEX),
+            ("nb", _ABBR_NB),
+            ("etc", _ETC_BAD),
+        )
+    ),
+    re.I,
+)
+
 
 def _etc_replacement(word: str) -> str:
     """Return the corrected casing and punctuation for ``etc``.
@@ -91,8 +111,10 @@ class AbbreviationRule(Rule):
         Returns:
             The updated string with corrected abbreviations and ellipsis usage.
         """
-        text = _ABBR_BAD.sub("c.-à-d.", text)
-        text = _ABBR_PEX.sub("p. ex.", text)
-        text = _ABBR_NB.sub("N. B.", text)
-        text = _ETC_BAD.sub(lambda m: _etc_replacement(m.group("word")), text)
-        return text
+
+        def replace(match: re.Match) -> str:
+            if match.lastgroup == "etc":
+                return _etc_replacement(match.group("word"))
+            return _FIX_REPLACEMENTS[match.lastgroup]
+
+        return _ABBR_ANY.sub(replace, text)
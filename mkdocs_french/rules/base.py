@@ -20,12 +20,19 @@ from typing import Callable, List, Optional, Tuple
 
 RuleResult = Tuple[int, int, str, Optional[str]]
 
+RE_DIGIT = re.compile(r"\d")
+
 
 class Rule(ABC):
     """Abstract base class for every typographic rule in the plugin."""
 
     name: str
     config_attr: str
+    trigger_chars: str = ""
+    """Characters of which at least one must occur for the rule to match.
+
+    Leave empty when no such cheap pre-check exists for the rule.
+    """
 
     def __init__(self, name: str, config_attr: str) -> None:
         """Initialize a rule.
@@ -37,6 +44,21 @@ class Rule(ABC):
         self.name = name
         self.config_attr = config_attr
 
+    def may_apply(self, text: str) -> bool:
+        """Return whether the rule can possibly match the provided text.
+
+        The orchestrator calls this cheap pre-check before :meth:`detect` or
+        :meth:`fix`. It may return false positives but never false negatives.
+
+        Args:
+            text: Raw HTML or Markdown fragment about to be processed.
+
+        Returns:
+            ``False`` when the rule is guaranteed to leave the text untouched.
+        """
+        triggers = self.trigger_chars
+        return not triggers or any(char in text for char in triggers)
+
     @abstractmethod
     def detect(self, text: str) -> List[RuleResult]:
         """Return non-blocking findings for the provided text.
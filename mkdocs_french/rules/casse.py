@@ -52,10 +52,16 @@ COUNTRIES = [
 ]
 
 LOWERCASE_WORDS = MOIS + JOURS + LANGS
-COUNTRY_PATTERNS = [
-    (target, re.compile(rf"(?<!\w){re.escape(target)}(?!\w)", re.IGNORECASE))
-    for target in COUNTRIES
-]
+# Capitalized form -> expected lowercase form.
+LOWERCASE_FORMS = {word.capitalize(): word for word in LOWERCASE_WORDS}
+# Position of each capitalized form, to report findings in list order.
+LOWERCASE_ORDER = {form: index for index, form in enumerate(LOWERCASE_FORMS)}
+# A single scan finds both kinds of words. Group 1 holds a capitalized word;
+# otherwise ``lastindex - 2`` is the index of the (case-insensitive) country.
+CASSE_PATTERN = re.compile(
+    rf"\b({'|'.join(re.escape(form) for form in LOWERCASE_FORMS)})\b"
+    rf"|(?<!\w)(?i:{'|'.join(f'({re.escape(target)})' for target in COUNTRIES)})(?!\w)"
+)
 
 
 def _is_sentence_start(text: str, index: int) -> bool:
@@ -99,33 +105,43 @@ class CasseRule(Rule):
         Returns:
             A list of rule results where the preview contains the lowercase form.
         """
-        res: list[RuleResult] = []
-        for word in LOWERCASE_WORDS:
-            pattern = re.compile(rf"\b{word.capitalize()}\b")
-            for match in pattern.finditer(text):
-                if _is_sentence_start(match.string, match.start()):
+        # (list position, finding): words come first, then countries, each in
+        # the order of its list and, for one entry, in text order.
+        findings: list[tuple[int, RuleResult]] = []
+        for match in CASSE_PATTERN.finditer(text):
+            if match.lastindex == 1:
+                if _is_sentence_start(text, match.start()):
                     continue
-                res.append(
+                form = match.group(0)
+                findings.append(
                     (
-                        match.start(),
-                        match.end(),
-                        f"Casse incorrecte pour «{match.group(0)}»",
-                        word,
+                        LOWERCASE_ORDER[form],
+                        (
+                            match.start(),
+                            match.end(),
+                            f"Casse incorrecte pour «{form}»",
+                            LOWERCASE_FORMS[form],
+                        ),
                     )
                 )
-        for target, pattern in COUNTRY_PATTERNS:
-            for match in pattern.finditer(text):
-                if match.group(0) == target:
-                    continue
-                res.append(
+                continue
+            country_index = match.lastindex - 2
+            target = COUNTRIES[country_index]
+            if match.group(0) == target:
+                continue
+            findings.append(
+                (
+                    len(LOWERCASE_ORDER) + country_index,
                     (
                         match.start(),
                         match.end(),
                         f"Casse incorrecte pour le pays «{match.group(0)}»",
                         target,
-                    )
+                    ),
                 )
-        return res
+            )
+        findings.sort(key=lambda item: item[0])
+        return [result for _, result in findings]
 
     def fix(self, text: str) -> str:
         """Rewrite text so that targeted words use their canonical casing.
@@ -136,15 +152,12 @@ class CasseRule(Rule):
         Returns:
             The corrected string with the enforced lowercase or proper country casing.
         """
-        for word in LOWERCASE_WORDS:
-            pattern = re.compile(rf"\b{word.capitalize()}\b")
-
-            def lower_replacer(match: re.Match) -> str:
-                if _is_sentence_start(match.string, match.start()):
-                    return match.group(0)
-                return word
-
-            text = pattern.sub(lower_replacer, text)
-        for target, pattern in COUNTRY_PATTERNS:
-            text = pattern.sub(lambda _m, t=target: t, text)
-        return text
+
+        def replacer(match: re.Match) -> str:
+            if match.lastindex != 1:
+                return COUNTRIES[match.lastindex - 2]
+            if _is_sentence_start(match.string, match.start()):
+                return match.group(0)
+            return LOWERCASE_FORMS[match.group(0)]
+
+        return CASSE_PATTERN.sub(replacer, text)
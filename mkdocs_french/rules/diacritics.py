@@ -9,7 +9,14 @@ from ..dictionary import get_dictionary
 from .base import Rule, RuleResult
 
 
-WORD_PATTERN = re.compile(r"\b[^\W\d_]+\b", re.UNICODE)
+# Latin letters by case; Morphalou only knows Latin-script words.
+_LATIN_UPPER = "".join(c for c in map(chr, range(0x250)) if c.isupper())
+_LATIN_LOWER = "".join(c for c in map(chr, range(0x250)) if c.islower())
+# Words with an uppercase letter and no lowercase one: the regex engine skips
+# ordinary prose so the dictionary is only consulted for actual candidates.
+UPPERCASE_WORD_PATTERN = re.compile(
+    rf"\b[^\W\d_{_LATIN_LOWER}]*[{_LATIN_UPPER}][^\W\d_{_LATIN_LOWER}]*\b"
+)
 
 
 class DiacriticsRule(Rule):
@@ -19,6 +26,10 @@ class DiacriticsRule(Rule):
         """Register the rule in the orchestrator."""
         super().__init__(name="diacritics", config_attr="diacritics")
 
+    def may_apply(self, text: str) -> bool:
+        """Return whether the text contains at least one uppercase letter."""
+        return not text.islower()
+
     def detect(self, text: str) -> List[RuleResult]:
         """Return warnings for uppercase words missing diacritics.
 
@@ -29,15 +40,13 @@ class DiacriticsRule(Rule):
             A list of rule results previewing the accentized version of each word.
         """
         results: List[RuleResult] = []
-        dictionary = get_dictionary()
 
-        for match in WORD_PATTERN.finditer(text):
+        for match in UPPERCASE_WORD_PATTERN.finditer(text):
             word = match.group(0)
-            if not word:
-                continue
             if not word.isupper():
                 continue
-            accented = dictionary.accentize(word)
+            # Resolved per match so text without candidates never loads it.
+            accented = get_dictionary().accentize(word)
             if accented == word:
                 continue
             results.append(
@@ -60,13 +69,12 @@ class DiacriticsRule(Rule):
             The updated text where uppercase French words now include the proper
             accents when they exist in Morphalou.
         """
-        dictionary = get_dictionary()
 
         def repl(match: re.Match) -> str:
             word = match.group(0)
             if not word.isupper():
                 return word
-            accented = dictionary.accentize(word)
+            accented = get_dictionary().accentize(word)
             return accented or word
 
-        return WORD_PATTERN.sub(repl, text)
+        return UPPERCASE_WORD_PATTERN.sub(repl, text)
@@ -8,7 +8,10 @@ from ..dictionary import get_dictionary
 from .base import Rule, RuleResult
 
 
-WORD_PATTERN = re.compile(r"\b[^\W\d_]+\b", re.UNICODE)
+# Whole words containing an ``oe``/``ae`` digraph: the regex engine skips every
+# other word, so the dictionary is only consulted for actual candidates.
+CANDIDATE_PATTERN = re.compile(r"\b[^\W\d_]*[oOaA][eE][^\W\d_]*\b")
+DIGRAPH_PATTERN = re.compile(r"[oOaA][eE]")
 
 
 def _needs_ligature(word: str) -> bool:
@@ -18,7 +21,7 @@ def _needs_ligature(word: str) -> bool:
         word: Word to inspect.
 
     Returns:
-        ``True`` when the lowercased word contains ``oe`` or ``ae``.
+        ``True`` when the word contains ``oe`` or ``ae`` in any casing.
 
     Examples:
         >>> from mkdocs_french.rules.ligatures import _needs_ligature
@@ -27,8 +30,7 @@ def _needs_ligature(word: str) -> bool:
         >>> _needs_ligature("chat")
         False
     """
-    lowered = word.lower()
-    return "oe" in lowered or "ae" in lowered
+    return DIGRAPH_PATTERN.search(word) is not None
 
 
 class LigaturesRule(Rule):
@@ -38,6 +40,10 @@ class LigaturesRule(Rule):
         """Register the rule in the orchestrator."""
         super().__init__(name="ligatures", config_attr="ligatures")
 
+    def may_apply(self, text: str) -> bool:
+        """Return whether the text contains an ``oe``/``ae`` digraph."""
+        return _needs_ligature(text)
+
     def detect(self, text: str) -> list[RuleResult]:
         """Return warnings for words that can be ligaturized.
 
@@ -48,13 +54,11 @@ class LigaturesRule(Rule):
             A list of rule results where the preview contains the ligatured form.
         """
         results: list[RuleResult] = []
-        dictionary = get_dictionary()
 
-        for match in WORD_PATTERN.finditer(text):
+        for match in CANDIDATE_PATTERN.finditer(text):
             word = match.group(0)
-            if not _needs_ligature(word):
-                continue
-            ligatured = dictionary.ligaturize(word)
+            # Resolved per match so text without candidates never loads it.
+            ligatured = get_dictionary().ligaturize(word)
             if ligatured == word:
                 continue
             results.append(
@@ -77,12 +81,6 @@ class LigaturesRule(Rule):
             The corrected text with ``œ`` or ``æ`` ligatures inserted when
             relevant.
         """
-        dictionary = get_dictionary()
-
-        def repl(match: re.Match) -> str:
-            word = match.group(0)
-            if not _needs_ligature(word):
-                return word
-            return dictionary.ligaturize(word)
-
-        return WORD_PATTERN.sub(repl, text)
+        return CANDIDATE_PATTERN.sub(
+            lambda match: get_dictionary().ligaturize(match.group(0)), text
+        )
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, List, Sequence, Tuple
 
 from .base import Rule
 
 
+# Bound of the per-orchestrator memo of processed text fragments; menus, table
+# headers and other boilerplate repeat the same strings on every page.
+PROCESS_CACHE_SIZE = 4096
+# Only fragments up to this length are memoized: whole Markdown pages and long
+# paragraphs rarely repeat and would only be kept alive by the cache.
+PROCESS_CACHE_MAX_LENGTH = 200
+
+
 @dataclass(frozen=True)
 class RuleWarning:
     """Diagnostic returned when a rule reports a warning.
@@ -37,6 +46,7 @@ class RuleOrchestrator:
             rules: Iterable of rule instances to apply in order.
         """
         self._rules: Tuple[Rule, ...] = tuple(rules)
+        self._process_cached = lru_cache(maxsize=PROCESS_CACHE_SIZE)(self._process)
 
     @property
     def rules(self) -> Tuple[Rule, ...]:
@@ -70,14 +80,24 @@ class RuleOrchestrator:
             >>> warnings
             []
         """
+        levels = tuple(
+            getattr(level, "value", level) for level in map(level_lookup, self._rules)
+        )
+        if len(text) <= PROCESS_CACHE_MAX_LENGTH:
+            current, warnings = self._process_cached(text, levels)
+        else:
+            current, warnings = self._process(text, levels)
+        return current, list(warnings)
+
+    def _process(
+        self, text: str, levels: Tuple[object, ...]
+    ) -> tuple[str, Tuple[RuleWarning, ...]]:
+        """Uncached implementation of :meth:`process` for resolved levels."""
         current = text
         warnings: List[RuleWarning] = []
 
-        for rule in self._rules:
-            level = level_lookup(rule)
-            level_value = getattr(level, "value", level)
-
-            if level_value == "ignore":
+        for rule, level_value in zip(self._rules, levels):
+            if level_value == "ignore" or not rule.may_apply(current):
                 continue
             if level_value == "warn":
                 for start, end, message, preview in rule.detect(current):
@@ -94,4 +114,4 @@ class RuleOrchestrator:
 
             current = rule.fix(current)
 
-        return current, warnings
+        return current, tuple(warnings)
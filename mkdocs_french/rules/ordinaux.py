@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 from typing import Optional
 
-from .base import Rule, RuleResult
+from .base import RE_DIGIT, Rule, RuleResult
 
 
 ORDINAL_SUFFIXES = [
@@ -54,6 +55,9 @@ REPLACEMENTS = {
     "ère": "re",
 }
 
+# REPLACEMENTS in application order: longest spellings first.
+_REPLACEMENT_ORDER = tuple(sorted(REPLACEMENTS.items(), key=lambda item: -len(item[0])))
+
 FIRST_SUFFIX_MAP = {
     "er": "er",
     "ier": "er",
@@ -101,11 +105,7 @@ def _normalize_suffix(number: str, suffix: str) -> Optional[str]:
         >>> _normalize_suffix("3", "er") is None
         True
     """
-    normalized = suffix.lower()
-    for original, replacement in sorted(
-        REPLACEMENTS.items(), key=lambda item: -len(item[0])
-    ):
-        normalized = normalized.replace(original, replacement)
+    normalized = _canonical_suffix(suffix)
 
     if number == "1":
         return FIRST_SUFFIX_MAP.get(normalized)
@@ -116,6 +116,22 @@ def _normalize_suffix(number: str, suffix: str) -> Optional[str]:
     return GENERAL_SUFFIX_MAP.get(normalized)
 
 
+@lru_cache(maxsize=256)
+def _canonical_suffix(suffix: str) -> str:
+    """Return the lowercase, accent-free spelling of an ordinal suffix.
+
+    Args:
+        suffix: Raw suffix matched by :data:`ORDINAL_PATTERN`.
+
+    Returns:
+        The suffix rewritten with :data:`REPLACEMENTS`.
+    """
+    normalized = suffix.lower()
+    for original, replacement in _REPLACEMENT_ORDER:
+        normalized = normalized.replace(original, replacement)
+    return normalized
+
+
 class OrdinauxRule(Rule):
     """Convert textual ordinal suffixes into Markdown caret notation."""
 
@@ -123,6 +139,10 @@ class OrdinauxRule(Rule):
         """Register the rule in the orchestrator."""
         super().__init__(name="ordinaux", config_attr="ordinaux")
 
+    def may_apply(self, text: str) -> bool:
+        """Return whether the text contains a digit, required by every ordinal."""
+        return RE_DIGIT.search(text) is not None
+
     def detect(self, text: str) -> list[RuleResult]:
         """Return warnings for ordinals written without caret markers.
 
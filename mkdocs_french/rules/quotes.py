@@ -14,6 +14,8 @@ RE_ASCII_QUOTES = re.compile(r'"([^"\n]+)"')
 class QuotesRule(Rule):
     """Replace ASCII quotes with French guillemets and narrow spacing."""
 
+    trigger_chars = '"'
+
     def __init__(self) -> None:
         """Register the rule in the orchestrator."""
         super().__init__(name="quotes", config_attr="quotes")
@@ -8,19 +8,44 @@ from ..constants import ELLIPSIS, NBSP, NNBSP
 from .base import Rule, RuleResult, regex_finditer
 
 
-RE_PUNCT_HIGH = re.compile(r"\s*([;!?»])")
-RE_COLON = re.compile(r"\s*(:)")
+# High punctuation, closing guillemet, and colon share a single pass.
+RE_PUNCT_SPACE = re.compile(r"\s*([;!?»:])")
 RE_GUIL_OPEN = re.compile(r"«\s*")
-RE_GUIL_CLOSE = re.compile(r"\s*»")
 RE_ELLIPSIS = re.compile(r"\.\.\.")
 RE_FINAL_PUNCT_DOT = re.compile(r"([!?])(\s*)\.(?=(?:\s|$|[»\"')]))")
 RE_COMMA_BEFORE_ELLIPSIS = re.compile(r",\s*(\.\.\.|…)")
-RE_DOUBLE_HYPHEN = re.compile(r"(?<!-)--(?!-)")
+# Patterns start with their literal and check the preceding context with a
+# lookbehind afterwards: a leading lookbehind would defeat the regex engine's
+# literal-prefix search and be attempted at every position of the text.
+RE_DOUBLE_HYPHEN = re.compile(r"--(?<!---)(?!-)")
+RE_APOSTROPHE = re.compile(r"'(?<=\w')(?=\w)")
+RE_MISSING_PUNCT_SPACE = re.compile(r"([:;!?»])(?<![\u00A0\u202F][:;!?»])")
+RE_GUIL_OPEN_MISSING_SPACE = re.compile(r"«(?!\u202F)")
+RE_GUIL_CLOSE_MISSING_SPACE = re.compile(r"»(?<!\u202F»)")
+
+
+# Replacement for each punctuation mark of RE_PUNCT_SPACE, built once instead
+# of concatenating a fresh string for every match.
+_SPACED_PUNCT = {char: (NBSP if char == ":" else NNBSP) + char for char in ";!?»:"}
+
+
+def _space_before_punctuation(match: re.Match) -> str:
+    """Return the punctuation preceded by its French typographic space.
+
+    Args:
+        match: Match of :data:`RE_PUNCT_SPACE`.
+
+    Returns:
+        A non-breaking space before a colon, a narrow one otherwise.
+    """
+    return _SPACED_PUNCT[match.group(1)]
 
 
 class SpacingRule(Rule):
     """Apply French typographic spacing conventions."""
 
+    trigger_chars = ":;!?«».…'-"
+
     def __init__(self) -> None:
         """Register the rule in the orchestrator."""
         super().__init__(name="spacing", config_attr="spacing")
@@ -37,7 +62,7 @@ class SpacingRule(Rule):
         """
         out: list[RuleResult] = []
         # Missing thin or non-breaking space before high punctuation
-        for match in re.finditer(r"(?<!\u00A0|\u202F)([:;!?»])", text):
+        for match in RE_MISSING_PUNCT_SPACE.finditer(text):
             char = match.group(1)
             exp = "fine" if char in ";!?»" else "insécable"
             out.append(
@@ -49,9 +74,9 @@ class SpacingRule(Rule):
                 )
             )
         # Guillemets missing thin spaces
-        if re.search(r"«(?!\u202F)", text):
+        if RE_GUIL_OPEN_MISSING_SPACE.search(text):
             out.append((0, 0, "Espace fine après « manquante", None))
-        if re.search(r"(?<!\u202F)»", text):
+        if RE_GUIL_CLOSE_MISSING_SPACE.search(text):
             out.append((0, 0, "Espace fine avant » manquante", None))
         # ASCII ellipsis "..."
         out += regex_finditer(
@@ -93,12 +118,9 @@ class SpacingRule(Rule):
         text = RE_COMMA_BEFORE_ELLIPSIS.sub(lambda m: m.group(1), text)
         text = RE_DOUBLE_HYPHEN.sub("—", text)
         # Curly apostrophes for elisions
-        text = re.sub(r"(?<=\w)'(?=\w)", "’", text)
+        text = RE_APOSTROPHE.sub("’", text)
         # Ellipsis normalization
         text = RE_ELLIPSIS.sub(ELLIPSIS, text)
         # Insert spacing before punctuation
-        text = RE_PUNCT_HIGH.sub(lambda m: NNBSP + m.group(1), text)
-        text = RE_COLON.sub(NBSP + ":", text)
-        text = RE_GUIL_OPEN.sub("«" + NNBSP, text)
-        text = RE_GUIL_CLOSE.sub(NNBSP + "»", text)
-        return text
+        text = RE_PUNCT_SPACE.sub(_space_before_punctuation, text)
+        return RE_GUIL_OPEN.sub("«" + NNBSP, text)
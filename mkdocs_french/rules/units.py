@@ -6,7 +6,7 @@ import re
 from typing import List, Tuple
 
 from ..constants import NBSP, NNBSP
-from .base import Rule, RuleResult
+from .base import RE_DIGIT, Rule, RuleResult
 
 
 # fmt: off
@@ -78,6 +78,10 @@ class UnitsRule(Rule):
         """Initialize the rule with the registry metadata."""
         super().__init__(name="units", config_attr="units")
 
+    def may_apply(self, text: str) -> bool:
+        """Return whether the text contains a digit, required by every match."""
+        return RE_DIGIT.search(text) is not None
+
     def detect(self, text: str) -> list[RuleResult]:
         """Return warnings for numbers that miss the expected spacing.
 
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import os.path
 import sys
 
 
 def _ensure_src_on_path() -> None:
     """Add the project root to ``sys.path`` during Poetry build hooks."""
 
-    project_root = Path(__file__).resolve().parents[1]
+    if "mkdocs_french" in sys.modules:
+        return
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     # ``poetry build`` runs this script from an isolated environment where the
     # project is not yet installed.  Importing the package would fail unless we
     # explicitly add the source tree to ``sys.path``.
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+
+# These imports must happen after sys.path has been patched for Poetry build hooks.
+_ensure_src_on_path()
+
+from mkdocs_french.artifacts import default_data_path  # noqa: E402
+from mkdocs_french.artifacts.build import build_morphalou_artifact  # noqa: E402
 
 
 def main() -> None:
@@ -23,12 +33,6 @@ def main() -> None:
     Raises:
         SystemExit: If the artifact was not produced as expected.
     """
-    _ensure_src_on_path()
-
-    # These imports must happen after sys.path has been patched for Poetry build hooks.
-    from mkdocs_french.artifacts import default_data_path
-    from mkdocs_french.artifacts.build import build_morphalou_artifact
-
     target = default_data_path()
     build_morphalou_artifact(target, force=True, quiet=False)
     if not target.exists():
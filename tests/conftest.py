@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import copy
+import gzip
+import importlib.util
+import json
 from pathlib import Path
+import shutil
 import sys
 import types
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING
 
-import markdown
 import pytest
 
 
@@ -13,14 +18,21 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-# ---------------------------------------------------------------------------
-# Provide minimal mkdocs stubs so the plugin can be imported without mkdocs
-# being installed in the current test environment. If mkdocs is available we
-# simply use the real package.
-# ---------------------------------------------------------------------------
-try:  # pragma: no cover - executed only when mkdocs is installed
-    import mkdocs  # type: ignore  # noqa: F401
-except ImportError:  # pragma: no cover - exercised when mkdocs missing
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from mkdocs_french.plugin import FrenchPlugin
+
+
+FAULTY_PAGE_MD = "C a d que le chanteur a capella voyage en france.\n".encode("utf-8")
+
+
+def _install_mkdocs_stubs() -> None:
+    """Provide minimal mkdocs stubs so the plugin imports without mkdocs.
+
+    If mkdocs is available we simply use the real package.
+    """
+    if importlib.util.find_spec("mkdocs") is not None:
+        return
+
     mkdocs_module = types.ModuleType("mkdocs")
 
     config_module = types.ModuleType("mkdocs.config")
@@ -66,14 +78,45 @@ except ImportError:  # pragma: no cover - exercised when mkdocs missing
     sys.modules["mkdocs.config.base"] = config_base_module
     sys.modules["mkdocs.plugins"] = plugins_module
 
-from mkdocs_french.constants import DEFAULT_ADMONITION_TRANSLATIONS
-from mkdocs_french.plugin import FrenchPlugin, Level, make_plugin_config
+
+# Test modules import the plugin at collection time, so the stubs cannot wait
+# for a fixture; the heavy plugin and Markdown imports are deferred instead.
+_install_mkdocs_stubs()
+
+
+@pytest.fixture(scope="session")
+def _plugin_template():
+    from mkdocs_french.constants import DEFAULT_ADMONITION_TRANSLATIONS
+    from mkdocs_french.plugin import FrenchPlugin
+
+    template = FrenchPlugin()
+    # No test writes to the translations, so every plugin shares one view.
+    template._admonition_translations = MappingProxyType(
+        DEFAULT_ADMONITION_TRANSLATIONS
+    )
+    return template
 
 
 @pytest.fixture
-def plugin_factory():
+def plugin_factory(_plugin_template):
+    from mkdocs_french.plugin import make_plugin_config
+    from mkdocs_french.rules import RuleOrchestrator
+
     def factory(**config_overrides):
-        plugin = FrenchPlugin()
+        # Rules are stateless and shared with the template. Orchestrators
+        # memoize processed text, so each plugin gets fresh ones; every mutable
+        # container gets a fresh instance too.
+        plugin = copy.copy(_plugin_template)
+        plugin._markdown_orchestrator = RuleOrchestrator(
+            _plugin_template._markdown_orchestrator.rules
+        )
+        plugin._html_orchestrator = RuleOrchestrator(
+            _plugin_template._html_orchestrator.rules
+        )
+        plugin._extra_css = set()
+        plugin._foreign_processed_pages = set()
+        plugin._previous_html_cache = {}
+        plugin._previous_admonition_cache = {}
         base_overrides = {
             "justify": False,
             "enable_css_bullets": False,
@@ -82,7 +125,6 @@ def plugin_factory():
         base_config = make_plugin_config(**base_overrides)
         plugin.config = base_config
         plugin._collected_warnings = []
-        plugin._admonition_translations = DEFAULT_ADMONITION_TRANSLATIONS.copy()
         plugin._docs_dir = Path.cwd() / "docs"
         return plugin
 
@@ -93,18 +135,61 @@ def plugin_factory():
 def page(tmp_path):
     src_file = tmp_path / "docs" / "index.md"
     src_file.parent.mkdir(parents=True, exist_ok=True)
-    src_file.write_text("# Dummy page\n", encoding="utf-8")
+    src_file.write_bytes(b"# Dummy page\n")
     return SimpleNamespace(
         file=SimpleNamespace(src_path="docs/index.md", abs_src_path=str(src_file))
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def render_with_plugin():
+    import markdown
+
+    converters: dict[tuple[str, ...], markdown.Markdown] = {}
+
     def renderer(plugin: FrenchPlugin, markdown_text: str, page, *, extensions=None):
-        extensions = extensions or []
+        key = tuple(extensions or ())
+        converter = converters.get(key)
+        if converter is None:
+            converter = converters[key] = markdown.Markdown(extensions=list(key))
         processed_md = plugin.on_page_markdown(markdown_text, page, {}, None)
-        html = markdown.markdown(processed_md, extensions=extensions)
+        html = converter.reset().convert(processed_md)
         return plugin.on_page_content(html, page, {}, None)
 
     return renderer
+
+
+@pytest.fixture(scope="session")
+def morphalou_artifact(tmp_path_factory):
+    """Write a small static Morphalou artifact once per session (read-only)."""
+    from mkdocs_french.artifacts import SCHEMA_VERSION
+
+    artifact = tmp_path_factory.mktemp("artifacts") / "morphalou_data.json.gz"
+    payload = {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": "2024-01-01T00:00:00Z",
+        "source": {"listing_url": "", "zip_pattern": ""},
+        "stats": {"word_count": 2, "ligature_entries": 1, "accent_entries": 1},
+        "words": ["oeuvre", "TEST"],
+        "ligature_map": {"oeuvre": "œuvre"},
+        "accent_map": {"test": ["test", "tést"]},
+    }
+    artifact.write_bytes(
+        gzip.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    )
+    return artifact
+
+
+@pytest.fixture(scope="session")
+def _canned_docs(tmp_path_factory):
+    base = tmp_path_factory.mktemp("canned_docs")
+    (base / "page.md").write_bytes(FAULTY_PAGE_MD)
+    return base
+
+
+@pytest.fixture
+def docs_dir(tmp_path, _canned_docs):
+    """Return a private copy of a docs tree holding one faulty ``page.md``."""
+    dest = tmp_path / "docs"
+    shutil.copytree(_canned_docs, dest)
+    return dest
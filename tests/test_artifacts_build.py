@@ -49,3 +49,20 @@ def test_build_morphalou_artifact_refuses_existing_file(monkeypatch, tmp_path):
 
     with pytest.raises(FileExistsError):
         build_morphalou_artifact(target, quiet=True)
+
+
+def test_build_morphalou_artifact_keeps_previous_file_on_failure(monkeypatch, tmp_path):
+    target = tmp_path / "artifact.json.gz"
+    target.write_bytes(b"existing")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("mkdocs_french.artifacts.build.Dictionary", DummyDictionary)
+    monkeypatch.setattr("mkdocs_french.artifacts.build.os.replace", failing_replace)
+
+    with pytest.raises(OSError):
+        build_morphalou_artifact(target, force=True, quiet=True)
+
+    assert target.read_bytes() == b"existing"
+    assert list(tmp_path.iterdir()) == [target]
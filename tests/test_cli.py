@@ -3,10 +3,15 @@ from __future__ import annotations
 import importlib
 from pathlib import Path
 
+import pytest
+
 from mkdocs_french import cli as cli_module
 from mkdocs_french.cli import main
 
 
+SAMPLE_MD = "C a d que le chanteur a capella voyage en france.\n".encode("utf-8")
+
+
 def test_cli_build_command(monkeypatch, tmp_path):
     target = tmp_path / "artifact.gz"
 
@@ -36,15 +41,7 @@ def test_module_main_imports_cli_main():
     assert module.main is main
 
 
-def test_cli_check_reports_issues(tmp_path, capsys):
-    docs_dir = tmp_path / "sources"
-    docs_dir.mkdir()
-    md_path = docs_dir / "page.md"
-    md_path.write_text(
-        "C a d que le chanteur a capella voyage en france.\n",
-        encoding="utf-8",
-    )
-
+def test_cli_check_reports_issues(docs_dir, capsys):
     exit_code = main(["check", "--docs-dir", str(docs_dir)])
     captured = capsys.readouterr()
 
@@ -54,14 +51,8 @@ def test_cli_check_reports_issues(tmp_path, capsys):
     assert "[foreign]" in captured.out
 
 
-def test_cli_fix_updates_files(tmp_path, capsys):
-    docs_dir = tmp_path / "docs"
-    docs_dir.mkdir()
+def test_cli_fix_updates_files(docs_dir, capsys):
     md_path = docs_dir / "page.md"
-    md_path.write_text(
-        "C a d que le chanteur a capella voyage en france.\n",
-        encoding="utf-8",
-    )
 
     exit_code = main(["fix", "--docs-dir", str(docs_dir)])
     captured_fix = capsys.readouterr()
@@ -69,7 +60,7 @@ def test_cli_fix_updates_files(tmp_path, capsys):
     assert exit_code == 0
     assert "Corrigé" in captured_fix.out
 
-    updated = md_path.read_text(encoding="utf-8")
+    updated = md_path.read_bytes().decode("utf-8")
     assert "c.-à-d." in updated
     assert "_a capella_" in updated
     assert "France" in updated
@@ -80,10 +71,58 @@ def test_cli_fix_updates_files(tmp_path, capsys):
     assert "Aucune correction nécessaire." in captured_check.out
 
 
-def test_cli_check_missing_directory(tmp_path, capsys):
+def test_cli_check_parallel_jobs_match_serial_output(tmp_path, capsys):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    for name in ("a.md", "b.md", "c.md"):
+        (docs_dir / name).write_bytes(SAMPLE_MD)
+
+    serial_exit = main(["check", "--docs-dir", str(docs_dir)])
+    serial_out = capsys.readouterr().out
+    parallel_exit = main(["check", "--docs-dir", str(docs_dir), "--jobs", "2"])
+    parallel_out = capsys.readouterr().out
+
+    assert serial_exit == parallel_exit == 1
+    assert parallel_out == serial_out
+
+
+def test_cli_rejects_invalid_jobs(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main(["check", "--docs-dir", str(tmp_path), "--jobs", "-1"])
+
+    assert "non-negative integer" in capsys.readouterr().err
+
+
+def test_cli_zero_jobs_uses_every_cpu(monkeypatch):
+    monkeypatch.setattr(cli_module.os, "cpu_count", lambda: 3)
+
+    args = cli_module._build_parser().parse_args(["check", "--jobs", "0"])
+
+    assert args.jobs == 3
+
+
+def test_analyze_markdown_skips_rules_that_cannot_apply(monkeypatch):
+    from mkdocs_french.rules.diacritics import DiacriticsRule
+
+    def fail(self, text):
+        raise AssertionError("rule should have been skipped")
+
+    monkeypatch.setattr(DiacriticsRule, "detect", fail)
+    monkeypatch.setattr(DiacriticsRule, "fix", fail)
+
+    issues, text = cli_module._analyze_markdown(
+        "texte sans majuscule\n", cli_module._build_cli_plugin()
+    )
+
+    assert text == "texte sans majuscule\n"
+    assert issues == []
+
+
+@pytest.mark.parametrize("command", ["check", "fix"])
+def test_cli_missing_directory(tmp_path, capsys, command):
     missing = tmp_path / "absent"
 
-    exit_code = main(["check", "--docs-dir", str(missing)])
+    exit_code = main([command, "--docs-dir", str(missing)])
     captured = capsys.readouterr()
 
     assert exit_code == 1
@@ -122,20 +161,10 @@ def test_cli_build_failure_is_reported(monkeypatch, capsys):
     assert "Error: boom" in captured.err
 
 
-def test_cli_fix_missing_directory(tmp_path, capsys):
-    missing = tmp_path / "absent"
-
-    exit_code = main(["fix", "--docs-dir", str(missing)])
-    captured = capsys.readouterr()
-
-    assert exit_code == 1
-    assert "Directory not found" in captured.err
-
-
 def test_cli_fix_reports_no_changes(tmp_path, capsys):
     docs_dir = tmp_path / "docs"
     docs_dir.mkdir()
-    (docs_dir / "page.md").write_text("Texte conforme.\n", encoding="utf-8")
+    (docs_dir / "page.md").write_bytes(b"Texte conforme.\n")
 
     exit_code = main(["fix", "--docs-dir", str(docs_dir)])
     captured = capsys.readouterr()
@@ -147,7 +176,7 @@ def test_cli_fix_reports_no_changes(tmp_path, capsys):
 def test_format_relative_handles_external_path(tmp_path):
     outside = tmp_path / "outer" / "file.md"
     outside.parent.mkdir(parents=True, exist_ok=True)
-    outside.write_text("x", encoding="utf-8")
+    outside.write_bytes(b"x")
 
     result = cli_module._format_relative(outside, tmp_path / "docs")
 
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 import gzip
-import json
+import zipfile
+
+import pytest
 
-from mkdocs_french.artifacts import SCHEMA_VERSION
 from mkdocs_french.dictionary import Dictionary
 
 
+BROKEN_ARTIFACT_GZ = gzip.compress(b"not-json")
+
+
+@lru_cache(maxsize=1)
+def _template_dictionary() -> Dictionary:
+    """Create the single temporary workdir shared by index-only dictionaries."""
+    return Dictionary(use_static_data=False)
+
+
 def make_dictionary(words: set[str]) -> Dictionary:
-    dictionary = Dictionary()
+    dictionary = copy.copy(_template_dictionary())
     dictionary.words = set(words)
     dictionary._build_indexes()
     dictionary._prepared = True
@@ -16,37 +28,51 @@ def make_dictionary(words: set[str]) -> Dictionary:
     return dictionary
 
 
-def test_ligaturize_returns_expected_form():
-    dictionary = make_dictionary({"œdipe"})
+@lru_cache(maxsize=None)
+def shared_dictionary(words: frozenset[str]) -> Dictionary:
+    """Return a dictionary shared by the tests that only read from it."""
+    return make_dictionary(set(words))
+
 
-    assert dictionary.ligaturize("oedipe") == "œdipe"
-    assert dictionary.ligaturize("Oedipe") == "Œdipe"
-    assert dictionary.ligaturize("OEDIPE") == "ŒDIPE"
+@pytest.mark.parametrize(
+    "word,expected",
+    [("oedipe", "œdipe"), ("Oedipe", "Œdipe"), ("OEDIPE", "ŒDIPE")],
+)
+def test_ligaturize_returns_expected_form(word, expected):
+    dictionary = shared_dictionary(frozenset({"œdipe"}))
+
+    assert dictionary.ligaturize(word) == expected
 
 
 def test_ligaturize_no_change_when_unknown():
-    dictionary = make_dictionary({"œdipe"})
+    dictionary = shared_dictionary(frozenset({"œdipe"}))
 
     assert dictionary.ligaturize("anaphore") == "anaphore"
 
 
-def test_accentize_unambiguous_word():
-    dictionary = make_dictionary({"évaluation"})
+@pytest.mark.parametrize(
+    "word,expected",
+    [
+        ("evaluation", "évaluation"),
+        ("Evaluation", "Évaluation"),
+        ("EVALUATION", "ÉVALUATION"),
+    ],
+)
+def test_accentize_unambiguous_word(word, expected):
+    dictionary = shared_dictionary(frozenset({"évaluation"}))
 
-    assert dictionary.accentize("evaluation") == "évaluation"
-    assert dictionary.accentize("Evaluation") == "Évaluation"
-    assert dictionary.accentize("EVALUATION") == "ÉVALUATION"
+    assert dictionary.accentize(word) == expected
 
 
 def test_accentize_respects_existing_diacritics():
-    dictionary = make_dictionary({"élève", "élevé"})
+    dictionary = shared_dictionary(frozenset({"élève", "élevé"}))
 
     assert dictionary.accentize("elève") == "élève"
     assert dictionary.accentize("élève") == "élève"
 
 
 def test_accentize_returns_original_when_ambiguous():
-    dictionary = make_dictionary({"élève", "élevé"})
+    dictionary = shared_dictionary(frozenset({"élève", "élevé"}))
 
     assert dictionary.accentize("eleve") == "eleve"
 
@@ -59,26 +85,13 @@ def test_accentize_handles_uppercase_fallback():
 
 
 def test_contains_returns_sorted_matches():
-    dictionary = make_dictionary({"œuvre", "cœur", "autre"})
+    dictionary = shared_dictionary(frozenset({"œuvre", "cœur", "autre"}))
 
     assert dictionary.contains("œ") == ("cœur", "œuvre")
 
 
-def test_dictionary_loads_static_artifact(tmp_path):
-    artifact = tmp_path / "morphalou_data.json.gz"
-    payload = {
-        "schema_version": SCHEMA_VERSION,
-        "generated_at": "2024-01-01T00:00:00Z",
-        "source": {"listing_url": "", "zip_pattern": ""},
-        "stats": {"word_count": 2, "ligature_entries": 1, "accent_entries": 1},
-        "words": ["oeuvre", "TEST"],
-        "ligature_map": {"oeuvre": "œuvre"},
-        "accent_map": {"test": ["test", "tést"]},
-    }
-    with gzip.open(artifact, "wt", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False)
-
-    dictionary = Dictionary(use_static_data=True, data_path=artifact)
+def test_dictionary_loads_static_artifact(morphalou_artifact):
+    dictionary = Dictionary(use_static_data=True, data_path=morphalou_artifact)
 
     assert dictionary.ligaturize("oeuvre") == "œuvre"
     assert dictionary.accentize("TEST") == "TÉST"
@@ -94,12 +107,12 @@ def test_dictionary_cleanup_removes_temp_dir():
 
 
 def test_ligaturize_handles_empty_word():
-    dictionary = make_dictionary({"œdipe"})
+    dictionary = shared_dictionary(frozenset({"œdipe"}))
     assert dictionary.ligaturize("") == ""
 
 
 def test_contains_empty_fragment_returns_empty():
-    dictionary = make_dictionary({"mot"})
+    dictionary = shared_dictionary(frozenset({"mot"}))
     assert dictionary.contains("") == ()
 
 
@@ -115,8 +128,7 @@ def test_dictionary_missing_static_artifact_triggers_index_build(tmp_path):
 
 def test_dictionary_invalid_artifact_logs_warning(tmp_path, caplog):
     artifact = tmp_path / "broken.json.gz"
-    with gzip.open(artifact, "wb") as handle:
-        handle.write(b"not-json")
+    artifact.write_bytes(BROKEN_ARTIFACT_GZ)
 
     with caplog.at_level("WARNING"):
         dictionary = Dictionary(use_static_data=True, data_path=artifact)
@@ -125,3 +137,50 @@ def test_dictionary_invalid_artifact_logs_warning(tmp_path, caplog):
 
     assert any("Artéfact Morphalou illisible" in record.message for record in caplog.records)
     assert dictionary.words  # fallback data loaded
+
+
+def test_word_caches_are_reset_when_indexes_change():
+    dictionary = make_dictionary({"œdipe"})
+    assert dictionary.accentize("ELEVE") == "ELEVE"
+    assert dictionary.ligaturize("oeuvre") == "oeuvre"
+
+    dictionary.words = {"élève", "œuvre"}
+    dictionary._build_indexes()
+
+    assert dictionary.accentize("ELEVE") == "ÉLÈVE"
+    assert dictionary.ligaturize("oeuvre") == "œuvre"
+
+
+def test_accentize_misses_do_not_grow_accent_index():
+    dictionary = make_dictionary({"élève"})
+    size = len(dictionary._accent_map)
+
+    assert dictionary.accentize("inconnu") == "inconnu"
+    assert len(dictionary._accent_map) == size
+
+
+def test_parse_all_xml_reads_entries_from_zip(tmp_path):
+    archive = tmp_path / "Morphalou_formatTEI.zip"
+    with zipfile.ZipFile(archive, "w") as handle:
+        handle.writestr(
+            "tei/noms.xml",
+            '<TEI xmlns="http://www.tei-c.org/ns/1.0"><entry>'
+            '<form orth="cœur"><orth>élève</orth></form>'
+            "</entry></TEI>",
+        )
+        handle.writestr("tei/broken.xml", "<TEI><form>")
+        handle.writestr("README.txt", "<orth>ignoré</orth>")
+
+    dictionary = Dictionary(use_static_data=False, workdir=tmp_path)
+    dictionary.zip_path = archive
+    dictionary._parse_all_xml()
+
+    assert dictionary.words == {"cœur", "élève"}
+
+
+def test_accent_index_stores_single_variants_as_strings():
+    dictionary = shared_dictionary(frozenset({"évaluation", "élève", "élevé"}))
+
+    assert dictionary._accent_map["evaluation"] == "évaluation"
+    assert dictionary._accent_map["eleve"] == ("élevé", "élève")
+    assert dictionary._get_accent_candidates("evaluation") == ("évaluation",)
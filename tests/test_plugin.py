@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import re
 
+from html import unescape
 from types import SimpleNamespace
 
 from bs4 import BeautifulSoup
@@ -9,11 +11,20 @@ import pytest
 
 from mkdocs_french.constants import DEFAULT_ADMONITION_TRANSLATIONS, NBSP, NNBSP
 import mkdocs_french.plugin as plugin_module
-from mkdocs_french.plugin import Level
+from mkdocs_french.plugin import Level, WarningEntry
 from mkdocs_french.rules.base import Rule
 from mkdocs_french.rules.orchestrator import RuleOrchestrator, RuleWarning
 
 
+RE_PARAGRAPH = re.compile(r"<p\b[^>]*>(.*?)</p>", re.DOTALL)
+RE_TAG = re.compile(r"<[^>]+>")
+
+
+def p_texts(html: str) -> list[str]:
+    """Return the text of each paragraph, like ``get_text()`` on every ``<p>``."""
+    return [unescape(RE_TAG.sub("", body)) for body in RE_PARAGRAPH.findall(html)]
+
+
 class DummyRule(Rule):
     def __init__(self, *, detector=None, fixer=None) -> None:
         super().__init__(name="dummy", config_attr="spacing")
@@ -125,17 +136,55 @@ def test_on_post_build_copies_assets_and_cleans(tmp_path, plugin_factory):
     assert site_css.exists()
 
 
+def test_on_post_build_skips_up_to_date_assets(tmp_path, plugin_factory, monkeypatch):
+    plugin = plugin_factory(enable_css_bullets=True)
+    site_dir = tmp_path / "site"
+    plugin.on_config({"docs_dir": str(tmp_path / "docs"), "extra_css": []})
+    plugin.on_post_build({"site_dir": str(site_dir)})
+
+    copies = []
+    monkeypatch.setattr(
+        plugin_module.shutil, "copyfile", lambda src, dst: copies.append(dst)
+    )
+    plugin.on_post_build({"site_dir": str(site_dir)})
+
+    assert copies == []
+
+
+def test_on_post_build_releases_collected_warnings(
+    tmp_path, plugin_factory, monkeypatch
+):
+    plugin = plugin_factory(summary=True)
+    plugin._collected_warnings = [
+        WarningEntry(
+            rule="spacing",
+            file="docs/doc.md",
+            line=1,
+            column=1,
+            message="Espace fine",
+            preview=None,
+        )
+    ]
+    printed = []
+    monkeypatch.setattr(plugin, "_print_summary", lambda: printed.append(True))
+
+    plugin.on_post_build({"site_dir": str(tmp_path / "site")})
+
+    assert printed == [True]
+    assert plugin._collected_warnings == []
+
+
 def test_print_summary_with_rich(monkeypatch, plugin_factory):
     plugin = plugin_factory(summary=True)
     plugin._collected_warnings = [
-        {
-            "rule": "spacing",
-            "file": "docs/doc.md",
-            "line": 3,
-            "column": 5,
-            "message": "Espace fine",
-            "preview": ";",
-        }
+        WarningEntry(
+            rule="spacing",
+            file="docs/doc.md",
+            line=3,
+            column=5,
+            message="Espace fine",
+            preview=";",
+        )
     ]
 
     class DummyTable:
@@ -177,14 +226,14 @@ def test_print_summary_with_rich(monkeypatch, plugin_factory):
 def test_print_plain_summary_outputs(capsys, plugin_factory):
     plugin = plugin_factory(summary=True)
     plugin._collected_warnings = [
-        {
-            "rule": "spacing",
-            "file": "docs/doc.md",
-            "line": 2,
-            "column": 1,
-            "message": "Espace fine",
-            "preview": ";",
-        }
+        WarningEntry(
+            rule="spacing",
+            file="docs/doc.md",
+            line=2,
+            column=1,
+            message="Espace fine",
+            preview=";",
+        )
     ]
 
     plugin._print_plain_summary()
@@ -233,6 +282,49 @@ def test_orchestrator_fix_uses_fixer():
     assert not rule.detect_called
 
 
+def test_orchestrator_reuses_results_for_repeated_text():
+    calls = []
+    rule = DummyRule(
+        detector=lambda text: calls.append(text) or [(0, 1, "Message", None)]
+    )
+    orchestrator = RuleOrchestrator([rule])
+
+    first = orchestrator.process("texte", lambda _rule: Level.warn)
+    first[1].clear()
+    second = orchestrator.process("texte", lambda _rule: Level.warn)
+    fixed, warnings = orchestrator.process("texte", lambda _rule: Level.ignore)
+
+    assert calls == ["texte"]
+    assert len(second[1]) == 1
+    assert (fixed, warnings) == ("texte", [])
+
+
+def test_orchestrator_does_not_retain_long_text():
+    calls = []
+    rule = DummyRule(detector=lambda text: calls.append(text) or [])
+    orchestrator = RuleOrchestrator([rule])
+    long_text = "mot " * 1000
+
+    orchestrator.process(long_text, lambda _rule: Level.warn)
+    orchestrator.process(long_text, lambda _rule: Level.warn)
+
+    assert len(calls) == 2
+    assert orchestrator._process_cached.cache_info().currsize == 0
+
+
+def test_orchestrator_skips_rule_without_trigger_characters():
+    rule = DummyRule(fixer=lambda text: text.upper())
+    rule.trigger_chars = "!"
+    orchestrator = RuleOrchestrator([rule])
+
+    processed, _ = orchestrator.process("abc", lambda _rule: Level.fix)
+    assert processed == "abc"
+    assert not rule.fix_called
+
+    processed, _ = orchestrator.process("abc!", lambda _rule: Level.fix)
+    assert processed == "ABC!"
+
+
 def test_emit_warnings_logs_and_collects_summary(plugin_factory, caplog):
     plugin = plugin_factory(summary=True)
     rule = DummyRule()
@@ -249,14 +341,14 @@ def test_emit_warnings_logs_and_collects_summary(plugin_factory, caplog):
 
     assert "'docs/doc.md:7:3'" in caplog.text
     assert plugin._collected_warnings == [
-        {
-            "rule": "dummy",
-            "file": "docs/doc.md",
-            "line": 7,
-            "column": 3,
-            "message": "Message de test",
-            "preview": "fixe",
-        }
+        WarningEntry(
+            rule="dummy",
+            file="docs/doc.md",
+            line=7,
+            column=3,
+            message="Message de test",
+            preview="fixe",
+        )
     ]
 
 
@@ -295,7 +387,7 @@ def test_apply_markdown_rules_emits_warning_summary(plugin_factory, caplog):
     assert updated == "AA\nBB"
     assert "'docs/source.md:1:3'" in caplog.text
     assert plugin._collected_warnings
-    assert any(entry["line"] == 1 and entry["column"] == 3 for entry in plugin._collected_warnings)
+    assert any(entry.line == 1 and entry.column == 3 for entry in plugin._collected_warnings)
 
 
 def test_apply_foreign_markdown_warn_tracks_page(plugin_factory, caplog):
@@ -313,7 +405,7 @@ def test_apply_foreign_markdown_warn_tracks_page(plugin_factory, caplog):
     assert f"'docs/song.md:{line}:{column}'" in caplog.text
     assert "docs/song.md" in plugin._foreign_processed_pages
     assert any(
-        entry["line"] == line and entry["column"] == column
+        entry.line == line and entry.column == column
         for entry in plugin._collected_warnings
     )
 
@@ -401,6 +493,18 @@ def test_apply_foreign_in_html_italic_context(plugin_factory, page):
     assert span.get_text() == "de facto"
 
 
+def test_find_foreign_matches_short_and_long_texts():
+    pattern = re.compile(r"(?<![\w-])(de facto)(?![\w-])")
+    short = "Un état de facto."
+    long_text = short + " " * plugin_module.FOREIGN_MATCH_CACHE_MAX_LENGTH + short
+
+    assert plugin_module.find_foreign_matches(pattern, short) == ((8, 16, "de facto"),)
+    assert plugin_module.find_foreign_matches(pattern, short) is (
+        plugin_module.find_foreign_matches(pattern, short)
+    )
+    assert len(plugin_module.find_foreign_matches(pattern, long_text)) == 2
+
+
 def test_on_page_content_handles_empty_foreign_list(monkeypatch, plugin_factory, page):
     plugin = plugin_factory()
     monkeypatch.setattr("mkdocs_french.plugin.FOREIGN_LOCUTIONS", set())
@@ -423,6 +527,125 @@ def test_on_page_content_respects_processed_page_cache(plugin_factory, page):
     assert "docs/index.md" not in plugin._foreign_processed_pages
 
 
+def test_on_page_content_reuses_output_for_unchanged_pages(
+    monkeypatch, plugin_factory, page
+):
+    plugin = plugin_factory(spacing=Level.fix)
+    plugin.on_startup(command="serve", dirty=False)
+    html = "<p>Bonjour: test!</p>"
+    first = plugin.on_page_content(html, page, {}, None)
+
+    def fail(*_args):
+        raise AssertionError("page should not be reprocessed")
+
+    monkeypatch.setattr(plugin, "_process_html", fail)
+    assert plugin.on_page_content(html, page, {}, None) == first
+    # The cache is keyed on a digest of the page, not on the page itself.
+    assert html not in plugin._html_cache["docs/index.md"][0]
+
+    monkeypatch.undo()
+    plugin.config.spacing = Level.ignore
+    assert plugin.on_page_content(html, page, {}, None) != first
+
+
+def test_on_page_content_does_not_cache_outside_serve(
+    monkeypatch, plugin_factory, page
+):
+    plugin = plugin_factory(spacing=Level.fix)
+    plugin.on_startup(command="build", dirty=False)
+    html = "<p>Bonjour: test!</p>"
+    calls = []
+    process_html = plugin._process_html
+
+    def counting(*args):
+        calls.append(args)
+        return process_html(*args)
+
+    monkeypatch.setattr(plugin, "_process_html", counting)
+    plugin.on_page_content(html, page, {}, None)
+    plugin.on_page_content(html, page, {}, None)
+
+    assert len(calls) == 2
+    assert plugin._html_cache is None
+
+
+def test_html_cache_drops_pages_not_rendered_again(tmp_path, plugin_factory):
+    plugin = plugin_factory(spacing=Level.fix)
+    plugin.on_startup(command="serve", dirty=False)
+    mkdocs_config = {"docs_dir": str(tmp_path / "docs"), "extra_css": []}
+    kept = SimpleNamespace(file=SimpleNamespace(src_path="docs/kept.md"))
+    removed = SimpleNamespace(file=SimpleNamespace(src_path="docs/removed.md"))
+    html = "<p>Bonjour: test!</p>"
+
+    plugin.on_config(mkdocs_config)
+    plugin.on_page_content(html, kept, {}, None)
+    plugin.on_page_content(html, removed, {}, None)
+    plugin.on_config(mkdocs_config)
+    plugin.on_page_content(html, kept, {}, None)
+    plugin.on_config(mkdocs_config)
+
+    assert set(plugin._previous_html_cache) == {"docs/kept.md"}
+    assert plugin._html_cache == {}
+
+
+def test_on_page_content_reprocesses_pages_with_warnings(
+    plugin_factory, page, caplog
+):
+    plugin = plugin_factory(spacing=Level.warn)
+    plugin.on_startup(command="serve", dirty=False)
+    html = "<p>Bonjour: test!</p>"
+
+    with caplog.at_level(logging.WARNING):
+        plugin.on_page_content(html, page, {}, None)
+        plugin.on_page_content(html, page, {}, None)
+
+    assert caplog.text.count("[fr-typo:spacing]") >= 2
+    assert plugin._html_cache == {}
+
+
+def test_on_page_content_returns_html_untouched_when_all_rules_ignored(
+    monkeypatch, plugin_factory, page
+):
+    levels = {
+        name: Level.ignore
+        for name in (
+            "abbreviation",
+            "ordinaux",
+            "ligatures",
+            "casse",
+            "spacing",
+            "quotes",
+            "units",
+            "diacritics",
+            "foreign",
+        )
+    }
+    plugin = plugin_factory(**levels)
+    plugin._foreign_processed_pages.add("docs/index.md")
+    monkeypatch.setattr(plugin_module, "BeautifulSoup", None)
+    html = "<p>Bonjour: test!</p>"
+
+    assert plugin.on_page_content(html, page, {}, None) is html
+    assert "docs/index.md" not in plugin._foreign_processed_pages
+
+
+def test_plugins_pick_up_monkeypatched_dictionary(monkeypatch, plugin_factory, page):
+    import mkdocs_french.rules.diacritics as diacritics_module
+
+    levels = {"diacritics": Level.fix, "foreign": Level.ignore}
+    markdown_text = "Il faut voir cet ELEVE.\n"
+    plugin_factory(**levels).on_page_markdown(markdown_text, page, {}, None)
+
+    class DummyDictionary:
+        def accentize(self, word: str) -> str:
+            return "ÉLÈVE" if word == "ELEVE" else word
+
+    monkeypatch.setattr(diacritics_module, "get_dictionary", DummyDictionary)
+    result = plugin_factory(**levels).on_page_markdown(markdown_text, page, {}, None)
+
+    assert result == "Il faut voir cet ÉLÈVE.\n"
+
+
 def test_on_page_markdown_translates_admonition_title(plugin_factory, page):
     plugin = plugin_factory()
     markdown_text = "!!! warning\n    Attention\n"
@@ -433,6 +656,73 @@ def test_on_page_markdown_translates_admonition_title(plugin_factory, page):
     assert first_line == f'!!! warning "{DEFAULT_ADMONITION_TRANSLATIONS["warning"]}"'
 
 
+def test_on_page_markdown_translates_indented_admonitions_keeping_newlines(
+    plugin_factory, page
+):
+    plugin = plugin_factory()
+    markdown_text = "Texte\r\n  ???+ note inline\r\n    Contenu\r\n"
+
+    result = plugin.on_page_markdown(markdown_text, page, {}, None)
+
+    note = DEFAULT_ADMONITION_TRANSLATIONS["note"]
+    assert result == f'Texte\r\n  ???+ note inline "{note}"\r\n    Contenu\r\n'
+
+
+def test_translate_admonitions_returns_same_object_without_changes(plugin_factory):
+    plugin = plugin_factory()
+    markdown_text = 'Texte\n!!! note "Titre"\n    Contenu\n'
+
+    assert plugin._translate_admonitions(markdown_text) is markdown_text
+
+
+def test_translate_admonitions_reuses_results_across_serve_rebuilds(
+    monkeypatch, tmp_path, plugin_factory
+):
+    plugin = plugin_factory()
+    plugin.on_startup(command="serve", dirty=False)
+    mkdocs_config = {"docs_dir": str(tmp_path / "docs"), "extra_css": []}
+    calls = []
+    translate = plugin_module._translate_admonition_titles
+
+    def counting(markdown, translations):
+        calls.append(markdown)
+        return translate(markdown, translations)
+
+    monkeypatch.setattr(plugin_module, "_translate_admonition_titles", counting)
+    markdown_text = "!!! warning\n    Attention\n"
+
+    plugin.on_config(mkdocs_config)
+    first = plugin._translate_admonitions(markdown_text)
+    plugin.on_config(mkdocs_config)
+    second = plugin._translate_admonitions(markdown_text)
+
+    assert first == second != markdown_text
+    assert calls == [markdown_text]
+    assert all(markdown_text not in key for key in plugin._admonition_cache)
+
+
+def test_translate_admonitions_does_not_cache_outside_serve(
+    monkeypatch, plugin_factory
+):
+    plugin = plugin_factory()
+    plugin.on_startup(command="build", dirty=False)
+    calls = []
+    translate = plugin_module._translate_admonition_titles
+
+    def counting(markdown, translations):
+        calls.append(markdown)
+        return translate(markdown, translations)
+
+    monkeypatch.setattr(plugin_module, "_translate_admonition_titles", counting)
+    markdown_text = "!!! warning\n    Attention\n"
+
+    plugin._translate_admonitions(markdown_text)
+    plugin._translate_admonitions(markdown_text)
+
+    assert len(calls) == 2
+    assert plugin._admonition_cache is None
+
+
 def test_on_page_markdown_preserves_existing_title(plugin_factory, page):
     plugin = plugin_factory()
     markdown_text = '!!! warning "Titre existant"\n    Corps\n'
@@ -530,9 +820,8 @@ def test_on_page_content_applies_spacing_rule(plugin_factory, page):
     html = "<p>Bonjour: test!</p>"
 
     result = plugin.on_page_content(html, page, {}, None)
-    soup = BeautifulSoup(result, "html.parser")
 
-    assert soup.p.get_text() == f"Bonjour{NBSP}: test{NNBSP}!"
+    assert p_texts(result)[0] == f"Bonjour{NBSP}: test{NNBSP}!"
 
 
 def test_on_page_content_respects_ignore_markers(plugin_factory, page):
@@ -555,14 +844,27 @@ def test_on_page_content_respects_ignore_markers(plugin_factory, page):
     )
 
     result = plugin.on_page_content(html, page, {}, None)
-    soup = BeautifulSoup(result, "html.parser")
-    texts = [p.get_text() for p in soup.find_all("p")]
+    texts = p_texts(result)
 
     assert texts[0] == f"Premier{NBSP}: test{NNBSP}!"
     assert texts[1] == "Ignorer: test!"
     assert texts[2] == f"Dernier{NBSP}: test{NNBSP}!"
 
 
+def test_on_page_content_unterminated_ignore_start_covers_rest(plugin_factory, page):
+    plugin = plugin_factory(foreign=Level.ignore)
+    html = (
+        "<p>Premier: test</p>"
+        "<div><!--fr-typo-ignore-start--><p>Ignorer: test</p></div>"
+        "<p>Dernier: test</p>"
+    )
+
+    result = plugin.on_page_content(html, page, {}, None)
+    texts = p_texts(result)
+
+    assert texts == [f"Premier{NBSP}: test", "Ignorer: test", "Dernier: test"]
+
+
 def test_on_page_content_handles_documented_spacing_cases(
     plugin_factory, page, render_with_plugin
 ):
@@ -575,13 +877,12 @@ def test_on_page_content_handles_documented_spacing_cases(
     )
 
     rendered = render_with_plugin(plugin, markdown_text, page)
-    soup = BeautifulSoup(rendered, "html.parser")
 
     expected = (
         f"Tu n’as pas pris ton parapluie{NNBSP}! "
         "Tu vas encore — te faire mouiller, etc."
     )
-    assert soup.p.get_text() == expected
+    assert p_texts(rendered)[0] == expected
 
 
 def test_on_page_content_respects_ignore_classes(plugin_factory, page):
@@ -598,12 +899,29 @@ def test_on_page_content_respects_ignore_classes(plugin_factory, page):
     html = '<p>Normal: test!</p><p class="fr-typo-ignore">Ignorer: test!</p>'
 
     result = plugin.on_page_content(html, page, {}, None)
-    soup = BeautifulSoup(result, "html.parser")
-    texts = [p.get_text() for p in soup.find_all("p")]
+    texts = p_texts(result)
 
     assert texts[0] == f"Normal{NBSP}: test{NNBSP}!"
     assert texts[1] == "Ignorer: test!"
 
+
+def test_iter_text_nodes_follows_block_markers_inside_ignored_elements():
+    html = (
+        '<div class="fr-typo-ignore"><p>A</p><!--fr-typo-ignore-start--></div>'
+        "<p>B</p><!--fr-typo-ignore-end--><p>C</p>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+
+    texts = [str(node) for node, _ in plugin_module.iter_text_nodes(soup)]
+    pruned = [
+        str(node)
+        for node, _ in plugin_module.iter_text_nodes(soup, block_markers=False)
+    ]
+
+    assert texts == ["C"]
+    assert pruned == ["B", "C"]
+
+
 def test_on_page_content_inline_ignore_comment(plugin_factory, page):
     plugin = plugin_factory(
         abbreviation=Level.ignore,
@@ -618,8 +936,7 @@ def test_on_page_content_inline_ignore_comment(plugin_factory, page):
     html = "<p>Premier: test!</p><!--fr-typo-ignore--><p>Ignorer: test!</p>"
 
     result = plugin.on_page_content(html, page, {}, None)
-    soup = BeautifulSoup(result, "html.parser")
-    texts = [p.get_text() for p in soup.find_all("p")]
+    texts = p_texts(result)
 
     assert texts[0] == f"Premier{NBSP}: test{NNBSP}!"
     assert texts[1] == "Ignorer: test!"
@@ -637,6 +954,39 @@ def test_on_page_content_preserves_nohighlight_code(plugin_factory, page):
     assert not soup.find("em")
 
 
+def test_on_page_content_keeps_content_after_stray_closing_tag(plugin_factory, page):
+    plugin = plugin_factory()
+    html = "<p>Avant: test</p></div><p>Après</p>"
+
+    result = plugin.on_page_content(html, page, {}, None)
+
+    assert result == f"<p>Avant{NBSP}: test</p><p>Après</p>"
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        '<p class="fr-typo-ignore"><hr/>10 kg «x»</p>',
+        '<a data-fr-typo="ignore" href="#a"><a href="#b">lien</a>10 kg «x»</a>',
+        '<span class="fr-typo-ignore"><td>10 kg «x»</td></span>',
+        '<div class="fr-typo-ignore"><p>Avant<div>10 kg «x»</div></p></div>',
+    ],
+)
+def test_on_page_content_keeps_invalid_nesting_inside_ignored_elements(
+    plugin_factory, page, html
+):
+    plugin = plugin_factory()
+
+    assert plugin.on_page_content(html, page, {}, None) == html
+
+
+def test_on_page_content_returns_untouched_pages_verbatim(plugin_factory, page):
+    plugin = plugin_factory()
+    html = "<p class='note'>Texte conforme<br>R&amp;D</p>"
+
+    assert plugin.on_page_content(html, page, {}, None) is html
+
+
 def test_on_page_content_applies_foreign_italicization(
     plugin_factory, page, render_with_plugin
 ):
@@ -697,9 +1047,8 @@ def test_on_page_content_keeps_sentence_start_capital(
     markdown_text = "Erreur: Lundi, réunion."
 
     result = render_with_plugin(plugin, markdown_text, page)
-    soup = BeautifulSoup(result, "html.parser")
 
-    assert soup.p.get_text() == "Erreur: Lundi, réunion."
+    assert p_texts(result)[0] == "Erreur: Lundi, réunion."
 
 
 def test_on_page_content_uppercases_countries(
@@ -718,22 +1067,21 @@ def test_on_page_content_uppercases_countries(
     markdown_text = "voyage en france et espagne"
 
     result = render_with_plugin(plugin, markdown_text, page)
-    soup = BeautifulSoup(result, "html.parser")
 
-    assert soup.p.get_text() == "voyage en France et Espagne"
+    assert p_texts(result)[0] == "voyage en France et Espagne"
 
 
 def test_print_summary_plain_fallback(plugin_factory, capsys, monkeypatch):
     plugin = plugin_factory(summary=True)
     plugin._collected_warnings = [
-        {
-            "rule": "dummy",
-            "file": "docs/page.md",
-            "line": 3,
-            "column": 2,
-            "message": "Alerte",
-            "preview": "texte",
-        }
+        WarningEntry(
+            rule="dummy",
+            file="docs/page.md",
+            line=3,
+            column=2,
+            message="Alerte",
+            preview="texte",
+        )
     ]
 
     monkeypatch.setattr("mkdocs_french.plugin.Console", None)
@@ -780,14 +1128,14 @@ def test_print_summary_rich_table_style(plugin_factory, monkeypatch):
 
     plugin = plugin_factory(summary=True)
     plugin._collected_warnings = [
-        {
-            "rule": "dummy",
-            "file": "docs/page.md",
-            "line": 1,
-            "column": 1,
-            "message": "Test",
-            "preview": None,
-        }
+        WarningEntry(
+            rule="dummy",
+            file="docs/page.md",
+            line=1,
+            column=1,
+            message="Test",
+            preview=None,
+        )
     ]
 
     plugin._print_summary()
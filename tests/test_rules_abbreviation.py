@@ -14,3 +14,8 @@ def test_det_abbreviation_reports_extra_punctuation_after_etc():
     issues = rule.detect("Il viendra, etc...")
     assert any("Ponctuation superflue après «etc" in issue[2] for issue in issues)
     assert any(issue[3] == "etc." for issue in issues)
+
+
+def test_fix_abbreviation_handles_all_patterns_in_one_text():
+    text = "Cad le N.B, p ex ceci, etc..."
+    assert rule.fix(text) == "c.-à-d. le N. B., p. ex. ceci, etc."
@@ -55,3 +55,26 @@ def test_det_casse_detects_countries_needing_uppercase():
     results = rule.detect(text)
     replacements = {entry[3] for entry in results}
     assert {"France", "Royaume-Uni"} <= replacements
+
+
+def test_det_casse_reports_countries_in_list_order():
+    text = "la suisse, la france puis la suisse."
+    results = rule.detect(text)
+    assert [(entry[0], entry[3]) for entry in results] == [
+        (14, "France"),
+        (3, "Suisse"),
+        (29, "Suisse"),
+    ]
+
+
+def test_det_casse_reports_words_then_countries_in_list_order():
+    text = "la suisse en Mars, puis Lundi et Janvier en france, et Mars."
+    results = rule.detect(text)
+    assert [(entry[0], entry[3]) for entry in results] == [
+        (33, "janvier"),
+        (13, "mars"),
+        (55, "mars"),
+        (24, "lundi"),
+        (44, "France"),
+        (3, "Suisse"),
+    ]
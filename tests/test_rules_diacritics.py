@@ -28,3 +28,33 @@ def test_diacritics_detector_skips_capitalized(monkeypatch):
     results = rule.detect(text)
     assert len(results) == 1
     assert results[0][2] == "Diacritique manquant : «ECOLE» → «ÉCOLE»"
+
+
+def test_diacritics_only_consults_dictionary_for_uppercase_words(monkeypatch):
+    seen = []
+
+    class RecordingDictionary(DummyDictionary):
+        def accentize(self, word: str) -> str:
+            seen.append(word)
+            return super().accentize(word)
+
+    monkeypatch.setattr(diacritics_module, "get_dictionary", RecordingDictionary)
+    rule.fix("une ECOLE Ecole, NOËL et eTE ou A2")
+    assert seen == ["ECOLE", "NOËL"]
+
+
+def test_diacritics_may_apply_requires_uppercase():
+    assert rule.may_apply("une ECOLE")
+    assert rule.may_apply("2024")
+    assert not rule.may_apply("une école sans majuscule")
+
+
+def test_diacritics_does_not_load_dictionary_without_candidates(monkeypatch):
+    def fail():
+        raise AssertionError("dictionary loaded")
+
+    monkeypatch.setattr(diacritics_module, "get_dictionary", fail)
+    text = "Une Ecole en 2024"
+
+    assert rule.fix(text) == text
+    assert rule.detect(text) == []
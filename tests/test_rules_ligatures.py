@@ -22,3 +22,22 @@ def test_ligatures_fix_replaces(monkeypatch):
     monkeypatch.setattr(ligatures_module, "get_dictionary", lambda: DummyDictionary())
     fixed = rule.fix("Oeuvre et oeuvre")
     assert fixed == "Œuvre et œuvre"
+
+
+def test_ligatures_only_consults_dictionary_for_candidates(monkeypatch):
+    seen = []
+
+    class RecordingDictionary(DummyDictionary):
+        def ligaturize(self, word: str) -> str:
+            seen.append(word)
+            return super().ligaturize(word)
+
+    monkeypatch.setattr(ligatures_module, "get_dictionary", RecordingDictionary)
+    rule.fix("Une oeuvre de Caesar, sans rien 2oe d'autre")
+    assert seen == ["oeuvre", "Caesar"]
+
+
+def test_ligatures_may_apply_requires_digraph():
+    assert rule.may_apply("Un cOEur")
+    assert rule.may_apply("Caesar")
+    assert not rule.may_apply("Une œuvre sans digramme")
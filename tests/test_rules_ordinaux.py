@@ -35,3 +35,8 @@ def test_fix_ordinaux_converts_matches():
 )
 def test_normalize_suffix_cases(number, suffix, expected):
     assert ordinaux_module._normalize_suffix(number, suffix) == expected
+
+
+def test_ordinaux_may_apply_requires_digit():
+    assert rule.may_apply("le 2e jour")
+    assert not rule.may_apply("le deuxième jour")
@@ -34,3 +34,9 @@ def test_det_spacing_reports_new_spacing_issues():
     assert any("Ponctuation finale superflue" in msg for msg in messages)
     assert any("Virgule superflue avant ellipse" in msg for msg in messages)
     assert any("tiret cadratin" in msg.lower() for msg in messages)
+
+
+def test_spacing_may_apply_checks_trigger_characters():
+    assert rule.may_apply("Bonjour !")
+    assert rule.may_apply("l'arbre")
+    assert not rule.may_apply("Bonjour tout le monde")
@@ -21,3 +21,8 @@ def test_units_fix_inserts_narrow_nbsp():
     assert "20 °C" in fixed
     assert "50 kg" in fixed
     assert "10 kWh" in fixed
+
+
+def test_units_may_apply_requires_digit():
+    assert rule.may_apply("Il pèse 5 kg.")
+    assert not rule.may_apply("Il pèse des kg.")